@@ -14,24 +14,115 @@ Usage:
 
 import requests
 from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+import gzip
 import json
 import pandas as pd
 import re
 from urllib.parse import urljoin
 from typing import Dict, List, Optional
 import time
+from bisect import bisect_right
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from datetime import datetime
 
+try:
+    import orjson  # optional, much faster JSON parsing/serialization
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# Set to True to keep a gzipped copy of the scraped page for debugging
+DEBUG_MODE = False
+
+# Shared constants, built once at import time
+BASE_URL = 'https://openrouter.ai'
+MODEL_URL_BASE = BASE_URL + '/models/'
+PROVIDER_URL_BASE = BASE_URL + '/providers/'
+REQUIRED_FIELDS = ('id', 'name', 'provider', 'model_url', 'provider_url',
+                   'description', 'context_window', 'input_pricing',
+                   'output_pricing', 'image_pricing')
+KNOWN_PROVIDERS = frozenset(p.lower() for p in (
+    'openai', 'anthropic', 'google', 'meta-llama', 'mistralai', 'qwen'
+))
+_SLASH_TT = str.maketrans({'/': '--'})
+# Pricing tiers: <0.001 -> per M, <1 -> per K, else per token
+_PRICE_BOUNDS = (0.001, 1)
+_PRICE_FORMATS = ((1000000, '${:.2f}/M tokens'), (1000, '${:.2f}/K tokens'), (1, '${:.2f}/token'))
+_PRICE_BINS = [float('-inf'), *_PRICE_BOUNDS, float('inf')]
+_FREE_TYPES = frozenset(('input', 'output'))
+_ZERO_PRICES = frozenset(('0', '0.0', '0.00'))
+
+# Compiled once at import time instead of on every call
+_RE_MODEL_HREF = re.compile(r'/models/[^/]+$')
+_DESC_BLOCKS = frozenset(('p', 'div'))  # elements a description is read from
+# Provider, context and pricing details fused into one alternation so a
+# container's text is scanned once; the provider and image branches use
+# lookaheads so they don't swallow the fields that follow them.
+_RE_ALL = re.compile(
+    r'by\s+(?=(?P<provider>[^|$\n]+))'
+    r'|(?P<ctx>\d+(?:,\d+)*)\s*[KM]?\s*(?:context|tokens)'
+    r'|\$(?P<inp>[0-9.]+)/M\s+input'
+    r'|\$(?P<out>[0-9.]+)/M\s+output'
+    r'|\$(?P<img>[0-9.]+)/K(?=.*img)',
+    re.IGNORECASE
+)
+# Where a model list may live inside embedded page JSON, in lookup order
+_JSON_MODEL_PATHS = (
+    ('models',),
+    ('data',),
+    ('props', 'pageProps', 'models'),
+    ('props', 'pageProps', 'data'),
+)
+# All JSON-bearing script tags in one compiled XPath selector
+_XPATH_JSON_SCRIPTS = etree.XPath('//script[@type="application/json" or @id="__NEXT_DATA__"]')
+
+
+@lru_cache(maxsize=256)
+def _format_pricing(pricing: Optional[str], pricing_type: str) -> str:
+    """Cached body of OpenRouterParser.format_pricing; few distinct prices repeat a lot."""
+    empty = "Free" if pricing_type in _FREE_TYPES else ""
+    if not pricing:
+        return empty
+    
+    try:
+        if pricing in _ZERO_PRICES:
+            return empty
+        price_float = float(pricing)
+        if price_float == 0:
+            return empty
+        multiplier, fmt = _PRICE_FORMATS[bisect_right(_PRICE_BOUNDS, price_float)]
+        return fmt.format(price_float * multiplier)
+    except (ValueError, TypeError):
+        return str(pricing)
+
+
+@lru_cache(maxsize=1024)
+def model_url_for(model_id: str) -> str:
+    """OpenRouter page URL for a model id ('provider/model' -> .../provider--model)."""
+    return MODEL_URL_BASE + model_id.translate(_SLASH_TT)
+
+
+@lru_cache(maxsize=256)
+def provider_url_for(provider: str) -> str:
+    """OpenRouter page URL for a provider name."""
+    return PROVIDER_URL_BASE + provider.lower().replace(' ', '-')
+
 
 class OpenRouterParser:
     def __init__(self):
-        self.base_url = "https://openrouter.ai"
-        self.models_url = "https://openrouter.ai/models"
-        self.api_url = "https://openrouter.ai/api/v1/models"
+        self.base_url = BASE_URL
+        self.models_url = BASE_URL + "/models"
+        self.api_url = BASE_URL + "/api/v1/models"
         self.session = requests.Session()
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36'
         })
+        self._text_cache = {}  # id(node) -> text, only filled during extract_from_links
         
         # Failure tracking
         self.failures = []
@@ -83,27 +174,31 @@ class OpenRouterParser:
             response.raise_for_status()
             
             # Save HTML for debugging
-            with open('openrouter_page.html', 'w', encoding='utf-8') as f:
-                f.write(response.text)
-            print("💾 Saved HTML to openrouter_page.html")
+            if DEBUG_MODE:
+                with gzip.open('openrouter_page.html.gz', 'wt', encoding='utf-8') as f:
+                    f.write(response.text)
+                print("💾 Saved HTML to openrouter_page.html.gz")
             
-            soup = BeautifulSoup(response.content, 'html.parser')
+            soup = BeautifulSoup(response.content, 'lxml')
             models = []
             
             # Strategy 1: Look for model links
-            model_links = soup.find_all('a', href=re.compile(r'/models/[^/]+$'))
+            model_links = soup.find_all('a', href=_RE_MODEL_HREF)
             print(f"🔗 Found {len(model_links)} model links")
             
             if model_links:
                 models = self.extract_from_links(soup, model_links)
             
-            # Strategy 2: Look for JSON data
+            # Strategies 2-3 work on an lxml tree, only built when the links found nothing
             if not models:
-                models = self.extract_from_json(soup)
-            
-            # Strategy 3: Text pattern extraction
-            if not models:
-                models = self.extract_from_patterns(soup)
+                tree = lxml.html.fromstring(response.content)
+                
+                # Strategy 2: Look for JSON data
+                models = self.extract_from_json(tree)
+                
+                # Strategy 3: Text pattern extraction
+                if not models:
+                    models = self.extract_from_patterns(tree)
             
             if models:
                 self.stats['web_success'] += 1
@@ -126,6 +221,8 @@ class OpenRouterParser:
     def extract_from_links(self, soup, model_links) -> List[Dict]:
         """Extract models from HTML links."""
         models = []
+        timestamp = datetime.now().isoformat()  # shared by failures in this batch
+        container_details = {}  # id(container) -> extracted details
         
         for link in model_links[:50]:  # Limit to prevent too many attempts
             try:
@@ -136,17 +233,27 @@ class OpenRouterParser:
                     'id': link['href'].replace('/models/', '').replace('--', '/')
                 }
                 
-                # Find container with more info
+                # Find container with more info; sibling links share
+                # ancestors, so their text comes from the cache
                 container = link.parent
+                text = None
                 for _ in range(5):  # Look up to 5 levels up
                     if container and container.parent:
                         container = container.parent
-                        text = container.get_text()
+                        text = self.cached_text(container)
                         if 'tokens' in text and ('$' in text or 'free' in text.lower()):
                             break
                 
                 if container:
-                    self.extract_details_from_container(container, model_info)
+                    # Several links often resolve to the same container; only
+                    # run the extraction once per container
+                    details = container_details.get(id(container))
+                    if details is None:
+                        if text is None:  # no ancestors were walked
+                            text = self.cached_text(container)
+                        details = container_details[id(container)] = {}
+                        self.extract_details_from_container(container, text, details)
+                    model_info.update(details)
                 
                 if model_info.get('name'):
                     models.append(model_info)
@@ -156,71 +263,90 @@ class OpenRouterParser:
                     'method': 'link_extraction',
                     'link': str(link)[:100],
                     'error': str(e),
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': timestamp
                 })
                 continue
         
+        self._text_cache.clear()
         return models
 
-    def extract_details_from_container(self, container, model_info):
-        """Extract detailed info from HTML container."""
-        text = container.get_text()
+    def cached_text(self, node) -> str:
+        """Return node.get_text(), memoized by node identity for the current page."""
+        key = id(node)
+        text = self._text_cache.get(key)
+        if text is None:
+            text = self._text_cache[key] = node.get_text()
+        return text
+
+    def extract_details_from_container(self, container, text: str, model_info):
+        """Extract detailed info from HTML container and its get_text() output."""
+        # Single scan; keep the first match of each field
+        found = {}
+        for match in _RE_ALL.finditer(text):
+            field = match.lastgroup
+            if field not in found:
+                found[field] = match.group(field)
         
         # Extract provider
-        provider_match = re.search(r'by\s+([^|$\n]+)', text, re.IGNORECASE)
-        if provider_match:
-            provider = provider_match.group(1).strip()
+        if 'provider' in found:
+            provider = found['provider'].strip()
             model_info['provider'] = provider
-            model_info['provider_url'] = f"https://openrouter.ai/providers/{provider.lower().replace(' ', '-')}"
+            model_info['provider_url'] = provider_url_for(provider)
         
         # Extract context window
-        context_match = re.search(r'(\d+(?:,\d+)*)\s*[KM]?\s*(?:context|tokens)', text, re.IGNORECASE)
-        if context_match:
-            model_info['context_window'] = f"{context_match.group(1)} tokens"
+        if 'ctx' in found:
+            model_info['context_window'] = f"{found['ctx']} tokens"
         
         # Extract pricing
-        input_match = re.search(r'\$([0-9.]+)/M\s+input', text, re.IGNORECASE)
-        if input_match:
-            model_info['input_pricing'] = f"${input_match.group(1)}/M tokens"
+        if 'inp' in found:
+            model_info['input_pricing'] = f"${found['inp']}/M tokens"
         elif 'free' in text.lower():
             model_info['input_pricing'] = 'Free'
         else:
             model_info['input_pricing'] = ''
         
-        output_match = re.search(r'\$([0-9.]+)/M\s+output', text, re.IGNORECASE)
-        if output_match:
-            model_info['output_pricing'] = f"${output_match.group(1)}/M tokens"
+        if 'out' in found:
+            model_info['output_pricing'] = f"${found['out']}/M tokens"
         else:
             model_info['output_pricing'] = ''
         
-        image_match = re.search(r'\$([0-9.]+)/K.*img', text, re.IGNORECASE)
-        if image_match:
-            model_info['image_pricing'] = f"${image_match.group(1)}/K images"
+        if 'img' in found:
+            model_info['image_pricing'] = f"${found['img']}/K images"
         else:
             model_info['image_pricing'] = ''
         
-        # Extract description
-        desc_elements = container.find_all(['p', 'div'])
-        for elem in desc_elements:
-            elem_text = elem.get_text(strip=True)
-            if (len(elem_text) > 50 and 
-                'tokens' not in elem_text.lower() and 
-                '$' not in elem_text):
-                model_info['description'] = elem_text[:300]
+        # Extract description: first long paragraph that isn't pricing/context.
+        # One walk over the container's strings, grouped by their enclosing
+        # <p>/<div>, so inline markup (<b>, <a>, ...) stays part of the text
+        # and nested blocks are not re-read for every ancestor.
+        blocks = {}  # id(block) -> its strings, in document order
+        for string in container.strings:
+            block = string.parent
+            while block is not container and block.name not in _DESC_BLOCKS:
+                block = block.parent
+            if block is container and container.name not in _DESC_BLOCKS:
+                continue
+            blocks.setdefault(id(block), []).append(string)
+        
+        for strings in blocks.values():
+            block_text = ' '.join(part for part in (string.strip() for string in strings) if part)
+            if (len(block_text) > 50 and
+                'tokens' not in block_text.lower() and
+                '$' not in block_text):
+                model_info['description'] = block_text[:300]
                 break
 
-    def extract_from_json(self, soup) -> List[Dict]:
+    def extract_from_json(self, tree) -> List[Dict]:
         """Extract models from JSON script tags."""
         models = []
         
-        # Look for JSON scripts
-        script_tags = soup.find_all('script', type='application/json')
-        script_tags.extend(soup.find_all('script', id='__NEXT_DATA__'))
+        # Look for JSON scripts (single XPath pass over the lxml tree)
+        script_tags = _XPATH_JSON_SCRIPTS(tree)
         
         for script in script_tags:
             try:
-                if script.string:
-                    data = json.loads(script.string)
+                if script.text:
+                    data = _json_loads(script.text)  # orjson errors subclass JSONDecodeError
                     found_models = self.parse_json_data(data)
                     if found_models:
                         models.extend(found_models)
@@ -233,44 +359,45 @@ class OpenRouterParser:
     def parse_json_data(self, data) -> List[Dict]:
         """Parse models from JSON data structure."""
         models = []
+        timestamp = datetime.now().isoformat()  # shared by failures in this batch
         
-        # Try different possible locations
-        possible_paths = [
-            data.get('models', []),
-            data.get('data', []),
-            data.get('props', {}).get('pageProps', {}).get('models', []),
-            data.get('props', {}).get('pageProps', {}).get('data', [])
-        ]
-        
-        for model_list in possible_paths:
+        # Try different possible locations, resolving each only when reached
+        for path in _JSON_MODEL_PATHS:
+            model_list = data
+            for key in path:
+                model_list = model_list.get(key) if isinstance(model_list, dict) else None
+            
             if isinstance(model_list, list) and model_list:
                 for item in model_list:
                     if isinstance(item, dict):
-                        model_info = self.format_json_model(item)
+                        model_info = self.format_json_model(item, timestamp)
                         if model_info:
                             models.append(model_info)
                 break
         
         return models
 
-    def format_json_model(self, item) -> Optional[Dict]:
+    def format_json_model(self, item, timestamp: Optional[str] = None) -> Optional[Dict]:
         """Format model from JSON item."""
         try:
+            get = item.get
+            model_id = get('id', '')
+            slash = model_id.find('/')
             model_info = {
-                'id': item.get('id', ''),
-                'name': item.get('name', ''),
-                'description': item.get('description', ''),
-                'provider': item.get('id', '').split('/')[0] if '/' in item.get('id', '') else '',
-                'model_url': f"https://openrouter.ai/models/{item.get('id', '').replace('/', '--')}"
+                'id': model_id,
+                'name': get('name', ''),
+                'description': get('description', ''),
+                'provider': model_id[:slash] if slash >= 0 else '',
+                'model_url': model_url_for(model_id)
             }
             
             # Context window
-            context = item.get('context_length', 0)
+            context = get('context_length', 0)
             if context:
                 model_info['context_window'] = f"{context:,} tokens"
             
             # Pricing
-            pricing = item.get('pricing', {})
+            pricing = get('pricing', {})
             if pricing:
                 model_info['input_pricing'] = self.format_pricing(pricing.get('prompt'), 'input')
                 model_info['output_pricing'] = self.format_pricing(pricing.get('completion'), 'output')
@@ -278,7 +405,7 @@ class OpenRouterParser:
             
             # Provider URL
             if model_info['provider']:
-                model_info['provider_url'] = f"https://openrouter.ai/providers/{model_info['provider']}"
+                model_info['provider_url'] = provider_url_for(model_info['provider'])
             
             return model_info if model_info.get('name') else None
             
@@ -287,33 +414,36 @@ class OpenRouterParser:
                 'method': 'json_parsing',
                 'item': str(item)[:100],
                 'error': str(e),
-                'timestamp': datetime.now().isoformat()
+                'timestamp': timestamp or datetime.now().isoformat()
             })
             return None
 
-    def extract_from_patterns(self, soup) -> List[Dict]:
-        """Extract models using text patterns."""
+    def extract_from_patterns(self, tree) -> List[Dict]:
+        """Extract models from /models/ link targets."""
         models = []
         
         try:
-            text = soup.get_text()
-            
-            # Find model ID patterns
-            model_pattern = r'([a-zA-Z0-9\-_]+/[a-zA-Z0-9\-_\.]+)'
-            potential_ids = re.findall(model_pattern, text)
-            
-            # Filter likely model IDs
-            providers = ['openai', 'anthropic', 'google', 'meta-llama', 'mistralai', 'qwen']
-            
-            for model_id in set(potential_ids):
-                provider = model_id.split('/')[0].lower()
-                if provider in providers:
+            # Model IDs live in anchor hrefs, no need to scan the page text;
+            # iterate lazily so we stop as soon as we have enough
+            seen = set()
+            for anchor in tree.iter('a'):
+                href = anchor.get('href', '')
+                if not href.startswith('/models/'):
+                    continue
+                model_id = href.removeprefix('/models/').replace('--', '/', 1)
+                if model_id in seen:
+                    continue
+                seen.add(model_id)
+                
+                # Filter likely model IDs
+                provider = model_id.partition('/')[0].lower()
+                if provider in KNOWN_PROVIDERS:
                     model_info = {
                         'id': model_id,
-                        'name': model_id.split('/')[-1].replace('-', ' ').title(),
+                        'name': model_id.rpartition('/')[2].replace('-', ' ').title(),
                         'provider': provider,
-                        'model_url': f"https://openrouter.ai/models/{model_id.replace('/', '--')}",
-                        'provider_url': f"https://openrouter.ai/providers/{provider}"
+                        'model_url': model_url_for(model_id),
+                        'provider_url': provider_url_for(provider)
                     }
                     models.append(model_info)
                     
@@ -331,81 +461,101 @@ class OpenRouterParser:
 
     def format_pricing(self, pricing: Optional[str], pricing_type: str = "tokens") -> str:
         """Format pricing for display."""
-        if not pricing or pricing == "0":
-            return "Free" if pricing_type in ["input", "output"] else ""
-        
         try:
-            price_float = float(pricing)
-            if price_float == 0:
-                return "Free" if pricing_type in ["input", "output"] else ""
-            elif price_float < 0.001:
-                return f"${price_float * 1000000:.2f}/M tokens"
-            elif price_float < 1:
-                return f"${price_float * 1000:.2f}/K tokens"
-            else:
-                return f"${price_float:.2f}/token"
-        except (ValueError, TypeError):
-            return str(pricing) if pricing else ""
+            return _format_pricing(pricing, pricing_type)
+        except TypeError:  # unhashable value, can't be cached
+            return str(pricing) if pricing else _format_pricing(None, pricing_type)
+
+    def format_pricing_series(self, pricing: pd.Series, pricing_type: str = "tokens") -> pd.Series:
+        """Format a whole pricing column at once (vectorized format_pricing)."""
+        empty = "Free" if pricing_type in _FREE_TYPES else ""
+        values = pd.to_numeric(pricing, errors='coerce')
+        buckets = pd.cut(values, bins=_PRICE_BINS, labels=False, right=False)
+        
+        # Unparseable prices pass through as text, like format_pricing
+        formatted = pricing.fillna('').astype(str)
+        for bucket, (multiplier, fmt) in enumerate(_PRICE_FORMATS):
+            in_bucket = buckets == bucket
+            formatted[in_bucket] = (values[in_bucket] * multiplier).map(fmt.format)
+        formatted[(formatted == '') | (values == 0)] = empty
+        
+        return formatted
 
     def format_api_data(self, api_models: List[Dict]) -> List[Dict]:
         """Format API data to consistent structure."""
-        formatted = []
+        if not api_models:
+            return []
         
-        for model in api_models:
-            provider = model.get('id', '').split('/')[0] if '/' in model.get('id', '') else ''
-            
-            formatted_model = {
-                'id': model.get('id', ''),
-                'name': model.get('name', ''),
-                'model_url': f"https://openrouter.ai/models/{model.get('id', '').replace('/', '--')}",
-                'description': model.get('description', ''),
-                'context_window': f"{model.get('context_length', 0):,} tokens" if model.get('context_length') else '',
-                'provider': provider,
-                'provider_url': f"https://openrouter.ai/providers/{provider}" if provider else '',
-                'input_pricing': self.format_pricing(model.get('pricing', {}).get('prompt'), "input"),
-                'output_pricing': self.format_pricing(model.get('pricing', {}).get('completion'), "output"),
-                'image_pricing': self.format_pricing(model.get('pricing', {}).get('image'), "image"),
-            }
-            formatted.append(formatted_model)
+        # Flatten once (pricing.prompt, ...) and build every field column-wise
+        df = pd.json_normalize(api_models)
+        
+        def column(name):
+            return df[name] if name in df else pd.Series(None, index=df.index, dtype=object)
+        
+        ids = column('id').fillna('')
+        id_parts = ids.str.partition('/')
+        provider = id_parts[0].where(id_parts[1] == '/', '')
+        context = pd.to_numeric(column('context_length'), errors='coerce').fillna(0).astype(int)
+        
+        formatted = pd.DataFrame({
+            'id': ids,
+            'name': column('name').fillna(''),
+            'model_url': MODEL_URL_BASE + ids.str.replace('/', '--', regex=False),
+            'description': column('description').fillna(''),
+            'context_window': context.map('{:,} tokens'.format).where(context != 0, ''),
+            'provider': provider,
+            'provider_url': (PROVIDER_URL_BASE + provider).where(provider != '', ''),
+            'input_pricing': self.format_pricing_series(column('pricing.prompt'), "input"),
+            'output_pricing': self.format_pricing_series(column('pricing.completion'), "output"),
+            'image_pricing': self.format_pricing_series(column('pricing.image'), "image"),
+        })
         
-        return formatted
+        return formatted.to_dict('records')
 
     def validate_models(self, models: List[Dict]) -> List[Dict]:
         """Validate and clean model data."""
         valid_models = []
+        timestamp = datetime.now().isoformat()  # shared by failures in this batch
         
         for model in models:
+            model_id = model.get('id')
+            provider = model.get('provider')
+            
             # Check essential fields
-            if not model.get('name') and not model.get('id'):
+            if not model_id and not model.get('name'):
                 self.stats['validation_failures'] += 1
                 self.failures.append({
                     'method': 'validation',
                     'model': str(model)[:100],
                     'error': 'Missing name and id',
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': timestamp
                 })
                 continue
             
             # Clean and generate missing fields
-            if model.get('id') and not model.get('model_url'):
-                model['model_url'] = f"https://openrouter.ai/models/{model['id'].replace('/', '--')}"
+            if model_id and not model.get('model_url'):
+                model['model_url'] = model_url_for(model_id)
             
-            if model.get('provider') and not model.get('provider_url'):
-                model['provider_url'] = f"https://openrouter.ai/providers/{model['provider'].lower()}"
+            if provider and not model.get('provider_url'):
+                model['provider_url'] = provider_url_for(provider)
             
             # Ensure all required fields exist
-            required_fields = ['id', 'name', 'provider', 'model_url', 'provider_url', 
-                             'description', 'context_window', 'input_pricing', 
-                             'output_pricing', 'image_pricing']
-            
-            for field in required_fields:
-                if field not in model:
-                    model[field] = ''
+            for field in REQUIRED_FIELDS:
+                model.setdefault(field, '')
             
             valid_models.append(model)
         
         return valid_models
 
+    def write_json(self, filename: str, data):
+        """Write data as indented UTF-8 JSON, using orjson when available."""
+        if orjson:
+            with open(filename, 'wb') as f:
+                f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        else:
+            with open(filename, 'w', encoding='utf-8') as f:
+                json.dump(data, f, indent=2, ensure_ascii=False)
+
     def save_results(self, models: List[Dict], method: str):
         """Save results to files."""
         if not models:
@@ -415,8 +565,8 @@ class OpenRouterParser:
         # Save CSV
         csv_filename = f"openrouter_models_{method}.csv"
         try:
-            df = pd.DataFrame(models)
-            df.to_csv(csv_filename, index=False, encoding='utf-8')
+            df = pd.DataFrame(models, columns=REQUIRED_FIELDS)
+            df.to_csv(csv_filename, index=False, encoding='utf-8', lineterminator='\n')
             print(f"✅ Saved {len(models)} models to {csv_filename}")
         except Exception as e:
             print(f"❌ Error saving CSV: {e}")
@@ -434,8 +584,7 @@ class OpenRouterParser:
                 'models': models
             }
             
-            with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            self.write_json(json_filename, output_data)
             print(f"✅ Saved {len(models)} models to {json_filename}")
         except Exception as e:
             print(f"❌ Error saving JSON: {e}")
@@ -455,8 +604,7 @@ class OpenRouterParser:
         }
         
         try:
-            with open('parsing_failures.json', 'w', encoding='utf-8') as f:
-                json.dump(failure_data, f, indent=2, ensure_ascii=False)
+            self.write_json('parsing_failures.json', failure_data)
             print(f"📋 Saved failure analysis ({len(self.failures)} failures)")
         except Exception as e:
             print(f"❌ Error saving failures: {e}")
@@ -470,25 +618,30 @@ class OpenRouterParser:
         print(f"\n📊 Parsing Summary:")
         print(f"✅ Total models: {len(models)}")
         
-        # Provider stats
-        providers = set(m.get('provider', 'Unknown') for m in models if m.get('provider'))
-        print(f"🏢 Providers: {len(providers)}")
-        
-        # Data completeness
-        with_pricing = len([m for m in models if m.get('input_pricing')])
-        with_description = len([m for m in models if m.get('description')])
-        free_models = len([m for m in models if m.get('input_pricing') == 'Free'])
+        # Provider and completeness stats in a single pass
+        providers = Counter()
+        with_pricing = with_description = free_models = 0
+        for m in models:
+            provider = m.get('provider')
+            if provider:
+                providers[provider] += 1
+            input_pricing = m.get('input_pricing')
+            if input_pricing:
+                with_pricing += 1
+                if input_pricing == 'Free':
+                    free_models += 1
+            if m.get('description'):
+                with_description += 1
         
+        print(f"🏢 Providers: {len(providers)}")
         print(f"💰 With pricing: {with_pricing}/{len(models)} ({with_pricing/len(models)*100:.1f}%)")
         print(f"📝 With description: {with_description}/{len(models)} ({with_description/len(models)*100:.1f}%)")
         print(f"🆓 Free models: {free_models}")
         
         # Top providers
         if providers:
-            from collections import Counter
-            provider_counts = Counter(m.get('provider', 'Unknown') for m in models)
             print(f"\n🏆 Top 5 Providers:")
-            for provider, count in provider_counts.most_common(5):
+            for provider, count in providers.most_common(5):
                 print(f"   {provider}: {count} models")
 
     def run(self, method='both'):
@@ -496,16 +649,15 @@ class OpenRouterParser:
         print("🚀 OpenRouter Model Parser v11 (Clean)")
         print("=" * 50)
         
-        api_models = []
-        web_models = []
-        
-        if method in ['api', 'both']:
-            api_models = self.fetch_models_via_api()
-            if api_models:
-                api_models = self.format_api_data(api_models)
+        # Both fetches are network bound, so run them side by side
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            api_future = executor.submit(self.fetch_models_via_api) if method in ['api', 'both'] else None
+            web_future = executor.submit(self.parse_web_interface) if method in ['web', 'both'] else None
+            api_models = api_future.result() if api_future else []
+            web_models = web_future.result() if web_future else []
         
-        if method in ['web', 'both']:
-            web_models = self.parse_web_interface()
+        if api_models:
+            api_models = self.format_api_data(api_models)
         
         # Choose best result
         if method == 'api' or (api_models and not web_models):
@@ -562,7 +714,8 @@ def main():
         print("\n📁 Files created:")
         print("- CSV and JSON files with model data")
         print("- parsing_failures.json (failure analysis)")
-        print("- openrouter_page.html (web page for debugging)")
+        if DEBUG_MODE:
+            print("- openrouter_page.html.gz (web page for debugging)")
         
         print(f"\n💡 Next steps:")
         print("1. Review the CSV/JSON files")
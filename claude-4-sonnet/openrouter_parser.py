@@ -3,20 +3,81 @@
 OpenRouter Model Parser - Clean Working Version
 
 Requirements:
-    pip install requests beautifulsoup4 pandas
+    pip install requests beautifulsoup4 lxml
 
 Usage:
     python openrouter_parser.py
 """
 
 import requests
-from bs4 import BeautifulSoup
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from bs4 import BeautifulSoup, SoupStrainer
+import csv
 import json
-import pandas as pd
 import re
 from urllib.parse import urljoin
 from typing import Dict, List, Optional
+from dataclasses import asdict, astuple, dataclass, fields
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
+from itertools import islice
+from functools import lru_cache
+
+try:
+    import orjson  # optional, much faster JSON parsing/serialization
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
+
+# HTTP settings shared by the API and web fetches
+REQUEST_TIMEOUT = 30  # seconds
+RETRY_ATTEMPTS = 3
+RETRY_DELAY = 2  # backoff factor, seconds
+MAX_MODEL_LINKS = 100  # Limit to prevent too many
+
+
+@dataclass(slots=True)
+class ModelRecord:
+    """One parsed model; field order is the CSV column order."""
+    id: str = ''
+    name: str = ''
+    provider: str = ''
+    provider_url: str = ''
+    model_url: str = ''
+    description: str = ''
+    context_window: str = ''
+    input_pricing: str = ''
+    output_pricing: str = ''
+    image_pricing: str = ''
+
+
+REQUIRED_FIELDS = tuple(f.name for f in fields(ModelRecord))
+
+# Compiled once at import time instead of on every call
+_MODEL_LINK_RE = re.compile(r'/models/')
+
+
+@lru_cache(maxsize=512)
+def _format_pricing(pricing: Optional[str], pricing_type: str) -> str:
+    """Cached body of OpenRouterParser.format_pricing; few distinct prices repeat a lot."""
+    if not pricing or pricing == "0":
+        return "Free" if pricing_type in ["input", "output"] else ""
+    
+    try:
+        price_float = float(pricing)
+        if price_float == 0:
+            return "Free" if pricing_type in ["input", "output"] else ""
+        elif price_float < 0.001:
+            return f"${price_float * 1000000:.2f}/M tokens"
+        elif price_float < 1:
+            return f"${price_float * 1000:.2f}/K tokens"
+        else:
+            return f"${price_float:.2f}/token"
+    except (ValueError, TypeError):
+        return str(pricing) if pricing else ""
 
 
 class OpenRouterParser:
@@ -25,6 +86,14 @@ class OpenRouterParser:
         self.models_url = "https://openrouter.ai/models"
         self.api_url = "https://openrouter.ai/api/v1/models"
         self.session = requests.Session()
+        # Pooled keep-alive connections with retry/backoff for transient errors
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=16,
+            max_retries=Retry(total=RETRY_ATTEMPTS, backoff_factor=RETRY_DELAY,
+                              status_forcelist=[429, 500, 502, 503, 504])
+        )
+        self.session.mount('https://', adapter)
         self.session.headers.update({
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         })
@@ -33,10 +102,10 @@ class OpenRouterParser:
         """Fetch models from OpenRouter API."""
         try:
             print("📡 Fetching models from API...")
-            response = self.session.get(self.api_url, timeout=30)
+            response = self.session.get(self.api_url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
-            data = response.json()
+            data = _json_loads(response.content)
             models = data.get('data', [])
             
             print(f"✅ API returned {len(models)} models")
@@ -46,7 +115,7 @@ class OpenRouterParser:
             print(f"❌ API failed: {e}")
             return []
 
-    def format_api_models(self, api_models: List[Dict]) -> List[Dict]:
+    def format_api_models(self, api_models: List[Dict]) -> List[ModelRecord]:
         """Format API models to consistent structure."""
         formatted_models = []
         
@@ -54,18 +123,18 @@ class OpenRouterParser:
             try:
                 provider = model.get('id', '').split('/')[0] if '/' in model.get('id', '') else ''
                 
-                formatted_model = {
-                    'id': model.get('id', ''),
-                    'name': model.get('name', ''),
-                    'description': model.get('description', ''),
-                    'provider': provider,
-                    'provider_url': f"https://openrouter.ai/{provider}" if provider else '',
-                    'model_url': f"https://openrouter.ai/{model.get('id', '')}" if model.get('id') else '',
-                    'context_window': f"{model.get('context_length', 0):,} tokens" if model.get('context_length') else '',
-                    'input_pricing': self.format_pricing(model.get('pricing', {}).get('prompt'), 'input'),
-                    'output_pricing': self.format_pricing(model.get('pricing', {}).get('completion'), 'output'),
-                    'image_pricing': self.format_pricing(model.get('pricing', {}).get('image'), 'image'),
-                }
+                formatted_model = ModelRecord(
+                    id=model.get('id', ''),
+                    name=model.get('name', ''),
+                    description=model.get('description') or '',
+                    provider=provider,
+                    provider_url=f"https://openrouter.ai/{provider}" if provider else '',
+                    model_url=f"https://openrouter.ai/{model.get('id', '')}" if model.get('id') else '',
+                    context_window=f"{model.get('context_length', 0):,} tokens" if model.get('context_length') else '',
+                    input_pricing=self.format_pricing(model.get('pricing', {}).get('prompt'), 'input'),
+                    output_pricing=self.format_pricing(model.get('pricing', {}).get('completion'), 'output'),
+                    image_pricing=self.format_pricing(model.get('pricing', {}).get('image'), 'image'),
+                )
                 formatted_models.append(formatted_model)
                 
             except Exception as e:
@@ -76,27 +145,16 @@ class OpenRouterParser:
 
     def format_pricing(self, pricing: Optional[str], pricing_type: str = "tokens") -> str:
         """Format pricing for display."""
-        if not pricing or pricing == "0":
-            return "Free" if pricing_type in ["input", "output"] else ""
-        
         try:
-            price_float = float(pricing)
-            if price_float == 0:
-                return "Free" if pricing_type in ["input", "output"] else ""
-            elif price_float < 0.001:
-                return f"${price_float * 1000000:.2f}/M tokens"
-            elif price_float < 1:
-                return f"${price_float * 1000:.2f}/K tokens"
-            else:
-                return f"${price_float:.2f}/token"
-        except (ValueError, TypeError):
-            return str(pricing) if pricing else ""
+            return _format_pricing(pricing, pricing_type)
+        except TypeError:  # unhashable value, can't be cached
+            return str(pricing) if pricing else _format_pricing(None, pricing_type)
 
-    def scrape_web_models(self) -> List[Dict]:
+    def scrape_web_models(self) -> List[ModelRecord]:
         """Attempt to scrape models from web interface."""
         try:
             print("🕷️  Attempting web scraping...")
-            response = self.session.get(self.models_url, timeout=30)
+            response = self.session.get(self.models_url, timeout=REQUEST_TIMEOUT)
             response.raise_for_status()
             
             # Save HTML for inspection
@@ -104,44 +162,37 @@ class OpenRouterParser:
                 f.write(response.text)
             print("💾 Saved page HTML to openrouter_page.html")
             
-            soup = BeautifulSoup(response.content, 'html.parser')
-            
             # Check if page seems to have meaningful content
             if len(response.text) < 5000:
                 print("⚠️  Page appears to be JavaScript-rendered")
                 return []
             
+            # Only links are used below, so let lxml build just the <a> nodes
+            soup = BeautifulSoup(response.content, 'lxml', parse_only=SoupStrainer('a', href=True))
+            
             models = []
             
-            # Try to find model links
-            all_links = soup.find_all('a', href=True)
-            model_links = [link for link in all_links 
-                          if re.search(r'/models/', link.get('href', ''))]
+            # Try to find model links, stopping once we have enough
+            model_links = list(islice(self.iter_model_links(soup), MAX_MODEL_LINKS))
             
             print(f"🔗 Found {len(model_links)} potential model links")
             
             # Extract basic info from links
-            for link in model_links[:100]:  # Limit to prevent too many
+            for link in model_links:
                 try:
                     href = link.get('href', '')
                     text = link.get_text(strip=True)
                     
                     if text and len(text) > 2:
-                        model_info = {
-                            'name': text,
-                            'model_url': urljoin(self.base_url, href),
-                            'id': href.replace('/models/', '').replace('--', '/'),
-                            'provider': href.split('/')[-1].split('--')[0] if '--' in href else 'unknown',
-                            'description': '',
-                            'context_window': '',
-                            'input_pricing': '',
-                            'output_pricing': '',
-                            'image_pricing': '',
-                            'provider_url': ''
-                        }
+                        model_info = ModelRecord(
+                            name=text,
+                            model_url=urljoin(self.base_url, href),
+                            id=href.replace('/models/', '').replace('--', '/'),
+                            provider=href.split('/')[-1].split('--')[0] if '--' in href else 'unknown'
+                        )
                         
-                        if model_info['provider'] != 'unknown':
-                            model_info['provider_url'] = f"https://openrouter.ai/providers/{model_info['provider']}"
+                        if model_info.provider != 'unknown':
+                            model_info.provider_url = f"https://openrouter.ai/providers/{model_info.provider}"
                         
                         models.append(model_info)
                         
@@ -155,36 +206,41 @@ class OpenRouterParser:
             print(f"❌ Web scraping failed: {e}")
             return []
 
-    def save_models(self, models: List[Dict], method: str):
+    def iter_model_links(self, soup):
+        """Yield links to model pages, skipping repeated hrefs."""
+        seen_hrefs = set()
+        for link in soup.find_all('a', href=True):
+            href = link['href']
+            if href not in seen_hrefs and _MODEL_LINK_RE.search(href):
+                seen_hrefs.add(href)
+                yield link
+
+    def save_models(self, models: List[ModelRecord], method: str):
         """Save models to CSV and JSON files."""
         if not models:
             print("⚠️  No models to save")
             return
         
-        # Save CSV
-        csv_filename = f"openrouter_models_{method}.csv"
+        # Write both files side by side; each reports its own errors
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            executor.submit(self.save_to_csv, models, f"openrouter_models_{method}.csv")
+            executor.submit(self.save_to_json, models, f"openrouter_models_{method}.json", method)
+
+    def save_to_csv(self, models: List[ModelRecord], csv_filename: str):
+        """Save models to a CSV file."""
         try:
-            df = pd.DataFrame(models)
-            # Ensure consistent column order
-            columns = ['id', 'name', 'provider', 'provider_url', 'model_url', 
-                      'description', 'context_window', 'input_pricing', 
-                      'output_pricing', 'image_pricing']
-            
-            # Add any missing columns
-            for col in columns:
-                if col not in df.columns:
-                    df[col] = ''
-            
-            # Reorder columns
-            df = df[columns]
-            df.to_csv(csv_filename, index=False, encoding='utf-8')
+            # Record fields are already in column order
+            with open(csv_filename, 'w', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f, lineterminator='\n')
+                writer.writerow(REQUIRED_FIELDS)
+                writer.writerows(astuple(model) for model in models)
             print(f"✅ Saved CSV: {csv_filename}")
             
         except Exception as e:
             print(f"❌ Error saving CSV: {e}")
-        
-        # Save JSON
-        json_filename = f"openrouter_models_{method}.json"
+
+    def save_to_json(self, models: List[ModelRecord], json_filename: str, method: str):
+        """Save models with run metadata to a JSON file."""
         try:
             output_data = {
                 'metadata': {
@@ -193,17 +249,21 @@ class OpenRouterParser:
                     'method': method,
                     'parser_version': '12.0'
                 },
-                'models': models
+                'models': [asdict(model) for model in models]
             }
             
-            with open(json_filename, 'w', encoding='utf-8') as f:
-                json.dump(output_data, f, indent=2, ensure_ascii=False)
+            if orjson:
+                with open(json_filename, 'wb') as f:
+                    f.write(orjson.dumps(output_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+            else:
+                with open(json_filename, 'w', encoding='utf-8') as f:
+                    json.dump(output_data, f, indent=2, ensure_ascii=False)
             print(f"✅ Saved JSON: {json_filename}")
             
         except Exception as e:
             print(f"❌ Error saving JSON: {e}")
 
-    def display_summary(self, models: List[Dict]):
+    def display_summary(self, models: List[ModelRecord]):
         """Display summary of parsed models."""
         if not models:
             print("❌ No models found")
@@ -212,30 +272,31 @@ class OpenRouterParser:
         print(f"\n📊 Summary:")
         print(f"   Total models: {len(models)}")
         
-        # Provider breakdown
-        providers = {}
+        # Provider breakdown and data completeness in a single pass
+        providers = Counter()
+        with_pricing = with_description = free_models = 0
         for model in models:
-            provider = model.get('provider', 'Unknown')
-            providers[provider] = providers.get(provider, 0) + 1
+            providers[model.provider or 'Unknown'] += 1
+            input_pricing = model.input_pricing
+            if input_pricing:
+                with_pricing += 1
+                if input_pricing == 'Free':
+                    free_models += 1
+            if model.description:
+                with_description += 1
         
         print(f"   Unique providers: {len(providers)}")
         
         # Top 5 providers
-        sorted_providers = sorted(providers.items(), key=lambda x: x[1], reverse=True)
         print(f"   Top providers:")
-        for provider, count in sorted_providers[:5]:
+        for provider, count in providers.most_common(5):
             print(f"      {provider}: {count} models")
         
-        # Data completeness
-        with_pricing = len([m for m in models if m.get('input_pricing')])
-        with_description = len([m for m in models if m.get('description')])
-        free_models = len([m for m in models if m.get('input_pricing') == 'Free'])
-        
         print(f"   Models with pricing: {with_pricing} ({with_pricing/len(models)*100:.1f}%)")
         print(f"   Models with description: {with_description} ({with_description/len(models)*100:.1f}%)")
         print(f"   Free models: {free_models}")
 
-    def run(self, method: str = 'api') -> List[Dict]:
+    def run(self, method: str = 'api') -> List[ModelRecord]:
         """Main parsing method."""
         print("🚀 OpenRouter Model Parser v12")
         print("=" * 40)
@@ -256,9 +317,12 @@ class OpenRouterParser:
             method_used = 'web_scraping'
             
         elif method == 'both':
-            # Try API first
-            api_models = self.fetch_api_models()
-            web_models = self.scrape_web_models()
+            # Both fetches are network bound, so run them side by side
+            with ThreadPoolExecutor(max_workers=2) as executor:
+                api_future = executor.submit(self.fetch_api_models)
+                web_future = executor.submit(self.scrape_web_models)
+                api_models = api_future.result()
+                web_models = web_future.result()
             
             if api_models and web_models:
                 if len(web_models) > len(api_models):
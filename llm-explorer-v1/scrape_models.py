@@ -1,10 +1,39 @@
 import requests
+from requests.adapters import HTTPAdapter
 from bs4 import BeautifulSoup
 import pandas as pd
+import numpy as np
 import json
-import time
 import re
-from urllib.parse import urljoin
+from collections import deque
+
+# Next.js embeds the page state as JSON in this script tag
+_NEXT_DATA_RE = re.compile(rb'<script id="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+
+# HTML fallback patterns
+_MODEL_CARD_RE = re.compile(r'model|card', re.I)
+_CONTEXT_RE = re.compile(r'context', re.I)
+_PRICING_RE = re.compile(r'pricing|\$', re.I)
+
+# Columns of the scraped models table
+MODEL_COLUMNS = ['name', 'id', 'description', 'context_length', 'pricing', 'provider',
+                 'architecture', 'capabilities', 'website', 'image_url']
+
+# Pricing keywords used to categorize models
+_FREE_PATTERN = r'free|0\.00|no cost|gratis'
+_PAID_PATTERN = r'\$|paid|premium|subscribe|credit'
+
+def create_session():
+    """
+    Create a keep-alive session with a pooled HTTPS adapter
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=16, pool_maxsize=16)
+    session.mount('https://', adapter)
+    return session
+
+# Shared for the life of the process, so repeated scrapes reuse the open connection
+_SESSION = create_session()
 
 def scrape_openrouter_models():
     """
@@ -20,33 +49,27 @@ def scrape_openrouter_models():
     try:
         # Fetch the main models page
         url = "https://openrouter.ai/models"
-        response = requests.get(url, headers=headers)
+        response = _SESSION.get(url, headers=headers, timeout=30)
         response.raise_for_status()
         
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Look for script tags that might contain model data
         models_data = []
         
-        # Try to find JSON data in script tags
-        script_tags = soup.find_all('script')
-        for script in script_tags:
-            if script.string and '__NEXT_DATA__' in script.string:
-                try:
-                    # Extract JSON data from Next.js
-                    json_data = json.loads(script.string)
-                    models_data = extract_models_from_next_data(json_data)
-                    if models_data:
-                        break
-                except json.JSONDecodeError:
-                    continue
+        # Try to find the Next.js JSON data without building a DOM
+        match = _NEXT_DATA_RE.search(response.content)
+        if match:
+            try:
+                json_data = json.loads(match.group(1))
+                models_data = extract_models_from_next_data(json_data)
+            except json.JSONDecodeError:
+                pass
         
         # If no data found in Next.js, try alternative parsing
         if not models_data:
+            soup = BeautifulSoup(response.content, 'lxml')
             models_data = extract_models_from_html(soup)
         
         # Convert to DataFrame
-        df = pd.DataFrame(models_data)
+        df = pd.DataFrame(models_data, columns=MODEL_COLUMNS)
         
         # Clean and categorize data
         df = clean_and_categorize_models(df)
@@ -103,27 +126,22 @@ def extract_models_from_next_data(json_data):
     
     return models
 
-def find_models_in_dict(data, max_depth=10):
+def find_models_in_dict(data):
     """
-    Recursively search for models in dictionary
+    Breadth-first search for models in dictionary
     """
-    if max_depth <= 0:
-        return None
+    queue = deque([data])
     
-    if isinstance(data, dict):
-        if 'models' in data:
-            return data['models']
+    while queue:
+        node = queue.popleft()
         
-        for key, value in data.items():
-            result = find_models_in_dict(value, max_depth - 1)
-            if result:
-                return result
-    
-    elif isinstance(data, list):
-        for item in data:
-            result = find_models_in_dict(item, max_depth - 1)
-            if result:
-                return result
+        if isinstance(node, dict):
+            if node.get('models'):
+                return node['models']
+            queue.extend(node.values())
+        
+        elif isinstance(node, list):
+            queue.extend(node)
     
     return None
 
@@ -134,7 +152,7 @@ def extract_models_from_html(soup):
     models = []
     
     # Look for model cards or containers
-    model_cards = soup.find_all(['div', 'article'], class_=re.compile(r'model|card', re.I))
+    model_cards = soup.find_all(['div', 'article'], class_=_MODEL_CARD_RE)
     
     for card in model_cards:
         try:
@@ -153,10 +171,10 @@ def extract_models_from_html(soup):
             # Extract any other relevant information
             for elem in card.find_all(['div', 'span']):
                 text = elem.get_text(strip=True)
-                if 'context' in text.lower():
+                if _CONTEXT_RE.search(text):
                     model_info['context_length'] = text
-                elif 'pricing' in text.lower() or '$' in text:
-                    model_info['pricing_info'] = text
+                elif _PRICING_RE.search(text):
+                    model_info['pricing'] = text
             
             if model_info.get('name'):
                 models.append(model_info)
@@ -173,43 +191,17 @@ def clean_and_categorize_models(df):
     if df.empty:
         return df
     
-    # Ensure required columns exist
-    required_columns = ['name', 'id', 'description', 'pricing', 'category']
-    for col in required_columns:
-        if col not in df.columns:
-            df[col] = ''
-    
-    # Categorize models based on pricing
-    def categorize_model(pricing_info):
-        if pd.isna(pricing_info) or pricing_info == '':
-            return 'Unknown'
-        
-        pricing_str = str(pricing_info).lower()
-        
-        # Check for free indicators
-        if any(keyword in pricing_str for keyword in ['free', '0.00', 'no cost', 'gratis']):
-            return 'Free'
-        
-        # Check for paid indicators
-        if any(keyword in pricing_str for keyword in ['$', 'paid', 'premium', 'subscribe', 'credit']):
-            return 'Paid'
-        
-        return 'Unknown'
-    
-    # Apply categorization
-    df['category'] = df['pricing'].apply(categorize_model)
-    
-    # Clean up pricing information
-    def clean_pricing(pricing_info):
-        if pd.isna(pricing_info):
-            return ''
-        
-        if isinstance(pricing_info, dict):
-            return json.dumps(pricing_info)
-        
-        return str(pricing_info)
+    # Categorize models based on pricing (missing pricing stays Unknown)
+    pricing_str = df['pricing'].where(df['pricing'].notna(), '').astype(str).str.lower()
+    free_mask = pricing_str.str.contains(_FREE_PATTERN, regex=True)
+    paid_mask = pricing_str.str.contains(_PAID_PATTERN, regex=True)
+    df['category'] = np.select([free_mask, paid_mask], ['Free', 'Paid'], default='Unknown')
     
-    df['pricing'] = df['pricing'].apply(clean_pricing)
+    # Clean up pricing information: serialize dicts, stringify the rest
+    pricing = df['pricing']
+    is_dict = pricing.map(type).eq(dict)
+    df['pricing'] = pricing.where(pricing.notna(), '').astype(str)
+    df.loc[is_dict, 'pricing'] = pricing[is_dict].map(json.dumps)
     
     # Clean other text fields
     text_columns = ['name', 'description', 'provider', 'architecture']
@@ -218,10 +210,10 @@ def clean_and_categorize_models(df):
             df[col] = df[col].apply(lambda x: str(x).strip() if pd.notna(x) else '')
     
     # Remove duplicates
-    df = df.drop_duplicates(subset=['name', 'id'])
+    df.drop_duplicates(subset=['name', 'id'], inplace=True)
     
     # Sort by category and name
-    df = df.sort_values(['category', 'name'])
+    df.sort_values(['category', 'name'], inplace=True)
     
     return df
 
@@ -1,3 +1,4 @@
+import os
 import streamlit as st
 import pandas as pd
 import numpy as np
@@ -6,6 +7,12 @@ import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime
 
+try:
+    import pyarrow  # noqa: F401  (enables the Parquet data file)
+    HAS_PARQUET = True
+except ImportError:
+    HAS_PARQUET = False
+
 # Set page configuration
 st.set_page_config(
     page_title="OpenRouter LLM Model Explorer",
@@ -58,25 +65,80 @@ st.markdown("""
 </style>
 """, unsafe_allow_html=True)
 
+DATA_FILE = 'openrouter_models.csv'
+PARQUET_FILE = 'openrouter_models.parquet'
+SEARCH_COLUMN = '_search_blob'
+CATEGORICAL_COLUMNS = ('category', 'provider', 'architecture')
+
+def newest_data_file():
+    """
+    Prefer the Parquet copy written by the scraper unless the CSV is newer
+    (e.g. regenerated by create_sample_data.py)
+    """
+    if not HAS_PARQUET or not os.path.exists(PARQUET_FILE):
+        return DATA_FILE
+    if os.path.exists(DATA_FILE) and os.path.getmtime(DATA_FILE) > os.path.getmtime(PARQUET_FILE):
+        return DATA_FILE
+    return PARQUET_FILE
+
+@st.cache_data
+def read_models_file(path, mtime):
+    """
+    Read the model data, its summary and its charts; mtime is part of the cache key
+    so a re-scrape is picked up
+    """
+    if path.endswith('.parquet'):
+        df = pd.read_parquet(path)
+    else:
+        df = pd.read_csv(path)
+    # Low-cardinality columns compare and count on integer codes
+    for col in CATEGORICAL_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+    # Lowercased name + description, searched in one pass per query
+    df[SEARCH_COLUMN] = (df['name'].fillna('') + '\n' + df['description'].fillna('')).str.lower()
+    return df, dataset_summary(df), create_visualizations(df)
+
 def load_data():
     """
-    Load model data from CSV file
+    Load model data, its summary and its charts from the Parquet or CSV file
     """
     try:
-        df = pd.read_csv('openrouter_models.csv')
-        return df
+        path = newest_data_file()
+        return read_models_file(path, os.path.getmtime(path))
     except FileNotFoundError:
         st.error("Model data file not found. Please run the scraper first.")
-        return None
+        return None, None, None
     except Exception as e:
         st.error(f"Error loading data: {e}")
-        return None
+        return None, None, None
+
+def dataset_summary(df):
+    """
+    Compute metric counts and filter options for the sidebar in one pass
+    """
+    category_counts = df['category'].value_counts()
+    summary = {
+        'total': len(df),
+        'free': int(category_counts.get('Free', 0)),
+        'paid': int(category_counts.get('Paid', 0)),
+        'categories': ['All'] + sorted(df['category'].unique().tolist()),
+        'providers': None
+    }
+    if 'provider' in df.columns:
+        summary['providers'] = ['All'] + sorted([p for p in df['provider'].dropna().unique() if p != ''])
+    return summary
 
-def create_aggrid_config(df):
+@st.cache_data
+def create_aggrid_config(columns, dtypes):
     """
     Create AgGrid configuration with search and filter options
+
+    Only the schema matters, so callers pass the column names and dtype
+    names as tuples to keep the cache key cheap to hash.
     """
-    gb = GridOptionsBuilder.from_dataframe(df)
+    schema_df = pd.DataFrame({col: pd.Series(dtype=dtype) for col, dtype in zip(columns, dtypes)})
+    gb = GridOptionsBuilder.from_dataframe(schema_df)
     
     # Configure grid options
     gb.configure_default_column(
@@ -100,7 +162,7 @@ def create_aggrid_config(df):
         "category",
         header_name="Category",
         width=120,
-        filter='agSetColumnFilter',
+        filter='agTextColumnFilter',
         cellStyle={'styleConditions': [
             {'condition': 'params.value == "Free"', 'style': {'backgroundColor': '#d1fae5', 'color': '#065f46'}},
             {'condition': 'params.value == "Paid"', 'style': {'backgroundColor': '#fed7aa', 'color': '#92400e'}},
@@ -127,7 +189,7 @@ def create_aggrid_config(df):
         "provider",
         header_name="Provider",
         width=150,
-        filter='agSetColumnFilter'
+        filter='agTextColumnFilter'
     )
     
     gb.configure_column(
@@ -144,11 +206,6 @@ def create_aggrid_config(df):
         pre_selected_rows=[]
     )
     
-    gb.configure_side_bar(
-        filters_panel=True,
-        columns_panel=True
-    )
-    
     gridOptions = gb.build()
     
     return gridOptions
@@ -257,8 +314,8 @@ def main():
     </div>
     """.format(datetime.now().strftime("%Y-%m-%d %H:%M:%S")), unsafe_allow_html=True)
     
-    # Load data
-    df = load_data()
+    # Load data (the summary and charts are cached alongside it, per file and mtime)
+    df, summary, figures = load_data()
     if df is None:
         st.stop()
     
@@ -270,28 +327,31 @@ def main():
         if st.button("🔄 Refresh Data"):
             st.rerun()
         
-        # Category filter
-        st.subheader("Filter by Category")
-        categories = ['All'] + sorted(df['category'].unique().tolist())
-        selected_category = st.selectbox("Select Category:", categories)
-        
-        # Provider filter
-        if 'provider' in df.columns:
-            providers = ['All'] + sorted([p for p in df['provider'].unique() if pd.notna(p) and p != ''])
-            selected_provider = st.selectbox("Select Provider:", providers)
-        else:
-            selected_provider = 'All'
-        
-        # Search functionality
-        st.subheader("Search Models")
-        search_term = st.text_input("Search by name or description:")
+        # Filters live in a form so typing or picking doesn't rerun the
+        # script until the user applies them
+        with st.form('filters'):
+            # Category filter
+            st.subheader("Filter by Category")
+            selected_category = st.selectbox("Select Category:", summary['categories'])
+            
+            # Provider filter
+            if summary['providers'] is not None:
+                selected_provider = st.selectbox("Select Provider:", summary['providers'])
+            else:
+                selected_provider = 'All'
+            
+            # Search functionality
+            st.subheader("Search Models")
+            search_term = st.text_input("Search by name or description:")
+            
+            st.form_submit_button("🔍 Apply Filters")
         
         # Show user guide button
         if st.button("📖 Show User Guide"):
             st.session_state['show_guide'] = not st.session_state.get('show_guide', False)
     
-    # Apply filters
-    filtered_df = df.copy()
+    # Apply filters (boolean indexing already returns new frames)
+    filtered_df = df
     
     if selected_category != 'All':
         filtered_df = filtered_df[filtered_df['category'] == selected_category]
@@ -300,10 +360,7 @@ def main():
         filtered_df = filtered_df[filtered_df['provider'] == selected_provider]
     
     if search_term:
-        search_mask = (
-            filtered_df['name'].str.contains(search_term, case=False, na=False) |
-            filtered_df['description'].str.contains(search_term, case=False, na=False)
-        )
+        search_mask = filtered_df[SEARCH_COLUMN].str.contains(search_term.lower(), regex=False)
         filtered_df = filtered_df[search_mask]
     
     # Main content area
@@ -318,25 +375,23 @@ def main():
     with col1:
         st.markdown(f"""
         <div class="metric-card">
-            <h3>{len(df)}</h3>
+            <h3>{summary['total']}</h3>
             <p>Total Models</p>
         </div>
         """, unsafe_allow_html=True)
     
     with col2:
-        free_count = len(df[df['category'] == 'Free'])
         st.markdown(f"""
         <div class="metric-card">
-            <h3>{free_count}</h3>
+            <h3>{summary['free']}</h3>
             <p>Free Models</p>
         </div>
         """, unsafe_allow_html=True)
     
     with col3:
-        paid_count = len(df[df['category'] == 'Paid'])
         st.markdown(f"""
         <div class="metric-card">
-            <h3>{paid_count}</h3>
+            <h3>{summary['paid']}</h3>
             <p>Paid Models</p>
         </div>
         """, unsafe_allow_html=True)
@@ -353,8 +408,8 @@ def main():
     st.subheader("📊 Model Analytics")
     col1, col2 = st.columns(2)
     
+    fig_category, fig_provider = figures
     with col1:
-        fig_category, fig_provider = create_visualizations(df)
         st.plotly_chart(fig_category, use_container_width=True)
     
     with col2:
@@ -368,16 +423,20 @@ def main():
     
     if not filtered_df.empty:
         # Prepare data for AgGrid
-        display_df = filtered_df.copy()
+        display_df = filtered_df.drop(columns=SEARCH_COLUMN)
         
         # Add some formatting
         if 'category' in display_df.columns:
-            display_df['category'] = display_df['category'].apply(
+            # Format each distinct category once; rows keep their codes
+            display_df = display_df.assign(category=display_df['category'].astype('category').cat.rename_categories(
                 lambda x: f'<span class="category-badge {x.lower()}-badge">{x}</span>'
-            )
+            ))
         
         # Create grid options
-        gridOptions = create_aggrid_config(display_df)
+        gridOptions = create_aggrid_config(
+            tuple(display_df.columns),
+            tuple(str(dtype) for dtype in display_df.dtypes)
+        )
         
         # Display AgGrid
         grid_response = AgGrid(
@@ -385,7 +444,7 @@ def main():
             gridOptions=gridOptions,
             height=600,
             width='100%',
-            enable_enterprise_modules=True,
+            enable_enterprise_modules=False,
             allow_unsafe_jscode=True,
             update_mode='MODEL_CHANGED'
         )
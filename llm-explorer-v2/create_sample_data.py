@@ -4,316 +4,211 @@ Create sample model data for testing the app without scraping
 """
 
 import csv
+import hashlib
 import json
+import os
+import re
+from collections import Counter
 
-def create_sample_models():
-    """Create a comprehensive sample dataset of LLM models"""
-    
-    models = [
-        {
-            'name': 'GPT-4',
-            'id': 'openai/gpt-4',
-            'description': 'Most capable GPT-4 model, great for complex tasks that require advanced reasoning',
-            'context_length': '8192',
-            'pricing': '$0.03/1K tokens',
-            'provider': 'OpenAI',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'reasoning'],
-            'website': 'https://openai.com/gpt-4',
-            'image_url': ''
-        },
-        {
-            'name': 'GPT-4 Turbo',
-            'id': 'openai/gpt-4-turbo',
-            'description': 'Latest GPT-4 model with improved capabilities and knowledge cutoff',
-            'context_length': '128000',
-            'pricing': '$0.01/1K tokens',
-            'provider': 'OpenAI',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'reasoning'],
-            'website': 'https://openai.com/gpt-4',
-            'image_url': ''
-        },
-        {
-            'name': 'Claude 2.1',
-            'id': 'anthropic/claude-2.1',
-            'description': 'Helpful, harmless, and honest AI assistant with large context window',
-            'context_length': '200000',
-            'pricing': '$0.011/1K tokens',
-            'provider': 'Anthropic',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'analysis'],
-            'website': 'https://anthropic.com/claude',
-            'image_url': ''
-        },
-        {
-            'name': 'Claude Instant',
-            'id': 'anthropic/claude-instant',
-            'description': 'Faster, more compact version of Claude for quick responses',
-            'context_length': '100000',
-            'pricing': '$0.0011/1K tokens',
-            'provider': 'Anthropic',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion'],
-            'website': 'https://anthropic.com/claude',
-            'image_url': ''
-        },
-        {
-            'name': 'Llama 2 70B',
-            'id': 'meta-llama/llama-2-70b-chat',
-            'description': 'Open source large language model from Meta',
-            'context_length': '4096',
-            'pricing': 'Free',
-            'provider': 'Meta',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion'],
-            'website': 'https://ai.meta.com/llama',
-            'image_url': ''
-        },
-        {
-            'name': 'Llama 2 13B',
-            'id': 'meta-llama/llama-2-13b-chat',
-            'description': 'Smaller open source model from Meta, faster but less capable',
-            'context_length': '4096',
-            'pricing': 'Free',
-            'provider': 'Meta',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion'],
-            'website': 'https://ai.meta.com/llama',
-            'image_url': ''
-        },
-        {
-            'name': 'Mistral 7B',
-            'id': 'mistralai/mistral-7b-instruct',
-            'description': 'High-performance open source model with strong reasoning capabilities',
-            'context_length': '8192',
-            'pricing': 'Free',
-            'provider': 'Mistral AI',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'reasoning'],
-            'website': 'https://mistral.ai',
-            'image_url': ''
-        },
-        {
-            'name': 'Mixtral 8x7B',
-            'id': 'mistralai/mixtral-8x7b-instruct',
-            'description': 'Mixture of Experts model with superior performance',
-            'context_length': '32768',
-            'pricing': '$0.0025/1K tokens',
-            'provider': 'Mistral AI',
-            'architecture': 'Mixture of Experts',
-            'capabilities': ['chat', 'completion', 'reasoning'],
-            'website': 'https://mistral.ai',
-            'image_url': ''
-        },
-        {
-            'name': 'Gemini Pro',
-            'id': 'google/gemini-pro',
-            'description': 'Google\'s most capable AI model with multimodal capabilities',
-            'context_length': '32768',
-            'pricing': '$0.0025/1K tokens',
-            'provider': 'Google',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'multimodal'],
-            'website': 'https://gemini.google.com',
-            'image_url': ''
-        },
-        {
-            'name': 'Gemini Ultra',
-            'id': 'google/gemini-ultra',
-            'description': 'Google\'s most advanced model with state-of-the-art performance',
-            'context_length': '32768',
-            'pricing': '$0.01/1K tokens',
-            'provider': 'Google',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'multimodal', 'reasoning'],
-            'website': 'https://gemini.google.com',
-            'image_url': ''
-        },
-        {
-            'name': 'Cohere Command',
-            'id': 'cohere/command',
-            'description': 'Enterprise-grade language model optimized for business applications',
-            'context_length': '4096',
-            'pricing': '$0.003/1K tokens',
-            'provider': 'Cohere',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'summarization'],
-            'website': 'https://cohere.com',
-            'image_url': ''
-        },
-        {
-            'name': 'Cohere Command R+',
-            'id': 'cohere/command-r-plus',
-            'description': 'Advanced version with improved reasoning and larger context',
-            'context_length': '128000',
-            'pricing': '$0.015/1K tokens',
-            'provider': 'Cohere',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'reasoning', 'summarization'],
-            'website': 'https://cohere.com',
-            'image_url': ''
-        },
-        {
-            'name': 'Perplexity Online',
-            'id': 'perplexity/perplexity-online',
-            'description': 'AI model with real-time internet access for up-to-date information',
-            'context_length': '4096',
-            'pricing': '$0.002/1K tokens',
-            'provider': 'Perplexity AI',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'web_search'],
-            'website': 'https://perplexity.ai',
-            'image_url': ''
-        },
-        {
-            'name': 'Qwen 72B',
-            'id': 'qwen/qwen-72b-chat',
-            'description': 'Large language model from Alibaba with strong multilingual capabilities',
-            'context_length': '32768',
-            'pricing': 'Free',
-            'provider': 'Alibaba',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'multilingual'],
-            'website': 'https://qwenlm.com',
-            'image_url': ''
-        },
-        {
-            'name': 'Yi 34B',
-            'id': '01-ai/yi-34b-chat',
-            'description': 'High-performance open source model with strong reasoning capabilities',
-            'context_length': '4096',
-            'pricing': 'Free',
-            'provider': '01.AI',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'reasoning'],
-            'website': 'https://01.ai',
-            'image_url': ''
-        },
-        {
-            'name': 'DeepSeek-V2',
-            'id': 'deepseek-ai/deepseek-v2',
-            'description': 'Advanced reasoning model with strong mathematical capabilities',
-            'context_length': '16384',
-            'pricing': '$0.002/1K tokens',
-            'provider': 'DeepSeek AI',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'reasoning', 'math'],
-            'website': 'https://deepseek.ai',
-            'image_url': ''
-        },
-        {
-            'name': 'Code Llama 34B',
-            'id': 'meta-llama/code-llama-34b',
-            'description': 'Specialized model for code generation and programming tasks',
-            'context_length': '16384',
-            'pricing': 'Free',
-            'provider': 'Meta',
-            'architecture': 'Transformer',
-            'capabilities': ['code', 'completion', 'chat'],
-            'website': 'https://ai.meta.com/llama',
-            'image_url': ''
-        },
-        {
-            'name': 'Solar Pro',
-            'id': 'upstage/solar-pro',
-            'description': 'Korean-language model with strong multilingual capabilities',
-            'context_length': '4096',
-            'pricing': '$0.005/1K tokens',
-            'provider': 'Upstage',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'multilingual'],
-            'website': 'https://upstage.ai',
-            'image_url': ''
-        },
-        {
-            'name': 'Nexus Raven',
-            'id': 'nexus-stream/nexus-raven',
-            'description': 'Specialized model for function calling and tool use',
-            'context_length': '4096',
-            'pricing': 'Free',
-            'provider': 'Nexus Flow',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion', 'function_calling'],
-            'website': 'https://nexusflow.ai',
-            'image_url': ''
-        },
-        {
-            'name': 'Phi-2',
-            'id': 'microsoft/phi-2',
-            'description': 'Small but capable model from Microsoft, good for local deployment',
-            'context_length': '2048',
-            'pricing': 'Free',
-            'provider': 'Microsoft',
-            'architecture': 'Transformer',
-            'capabilities': ['chat', 'completion'],
-            'website': 'https://azure.microsoft.com',
-            'image_url': ''
-        }
-    ]
-    
-    return models
+CSV_FILE = 'openrouter_models.csv'
+DIGEST_FILE = CSV_FILE + '.sha256'
+
+# Fields of each sample model, in literal order
+SAMPLE_FIELDS = ('name', 'id', 'description', 'context_length', 'pricing', 'provider',
+                 'architecture', 'capabilities', 'website', 'image_url')
+
+# Pricing keywords used to categorize models
+_FREE_RE = re.compile(r'free|0\.00|no cost|gratis|open source', re.IGNORECASE)
+_PAID_RE = re.compile(r'\$|paid|premium|subscribe|credit', re.IGNORECASE)
+
+# Column order of the generated CSV
+CSV_FIELDS = ['name', 'id', 'description', 'pricing', 'provider', 'category', 'context_length',
+              'architecture', 'capabilities', 'website', 'image_url']
+
+# Sample catalog: one tuple per model, in SAMPLE_FIELDS order
+_MODELS = (
+    ('GPT-4', 'openai/gpt-4',
+     'Most capable GPT-4 model, great for complex tasks that require advanced reasoning',
+     '8192', '$0.03/1K tokens', 'OpenAI', 'Transformer',
+     ('chat', 'completion', 'reasoning'),
+     'https://openai.com/gpt-4', ''),
+    ('GPT-4 Turbo', 'openai/gpt-4-turbo',
+     'Latest GPT-4 model with improved capabilities and knowledge cutoff',
+     '128000', '$0.01/1K tokens', 'OpenAI', 'Transformer',
+     ('chat', 'completion', 'reasoning'),
+     'https://openai.com/gpt-4', ''),
+    ('Claude 2.1', 'anthropic/claude-2.1',
+     'Helpful, harmless, and honest AI assistant with large context window',
+     '200000', '$0.011/1K tokens', 'Anthropic', 'Transformer',
+     ('chat', 'completion', 'analysis'),
+     'https://anthropic.com/claude', ''),
+    ('Claude Instant', 'anthropic/claude-instant',
+     'Faster, more compact version of Claude for quick responses',
+     '100000', '$0.0011/1K tokens', 'Anthropic', 'Transformer',
+     ('chat', 'completion'),
+     'https://anthropic.com/claude', ''),
+    ('Llama 2 70B', 'meta-llama/llama-2-70b-chat',
+     'Open source large language model from Meta',
+     '4096', 'Free', 'Meta', 'Transformer',
+     ('chat', 'completion'),
+     'https://ai.meta.com/llama', ''),
+    ('Llama 2 13B', 'meta-llama/llama-2-13b-chat',
+     'Smaller open source model from Meta, faster but less capable',
+     '4096', 'Free', 'Meta', 'Transformer',
+     ('chat', 'completion'),
+     'https://ai.meta.com/llama', ''),
+    ('Mistral 7B', 'mistralai/mistral-7b-instruct',
+     'High-performance open source model with strong reasoning capabilities',
+     '8192', 'Free', 'Mistral AI', 'Transformer',
+     ('chat', 'completion', 'reasoning'),
+     'https://mistral.ai', ''),
+    ('Mixtral 8x7B', 'mistralai/mixtral-8x7b-instruct',
+     'Mixture of Experts model with superior performance',
+     '32768', '$0.0025/1K tokens', 'Mistral AI', 'Mixture of Experts',
+     ('chat', 'completion', 'reasoning'),
+     'https://mistral.ai', ''),
+    ('Gemini Pro', 'google/gemini-pro',
+     "Google's most capable AI model with multimodal capabilities",
+     '32768', '$0.0025/1K tokens', 'Google', 'Transformer',
+     ('chat', 'completion', 'multimodal'),
+     'https://gemini.google.com', ''),
+    ('Gemini Ultra', 'google/gemini-ultra',
+     "Google's most advanced model with state-of-the-art performance",
+     '32768', '$0.01/1K tokens', 'Google', 'Transformer',
+     ('chat', 'completion', 'multimodal', 'reasoning'),
+     'https://gemini.google.com', ''),
+    ('Cohere Command', 'cohere/command',
+     'Enterprise-grade language model optimized for business applications',
+     '4096', '$0.003/1K tokens', 'Cohere', 'Transformer',
+     ('chat', 'completion', 'summarization'),
+     'https://cohere.com', ''),
+    ('Cohere Command R+', 'cohere/command-r-plus',
+     'Advanced version with improved reasoning and larger context',
+     '128000', '$0.015/1K tokens', 'Cohere', 'Transformer',
+     ('chat', 'completion', 'reasoning', 'summarization'),
+     'https://cohere.com', ''),
+    ('Perplexity Online', 'perplexity/perplexity-online',
+     'AI model with real-time internet access for up-to-date information',
+     '4096', '$0.002/1K tokens', 'Perplexity AI', 'Transformer',
+     ('chat', 'completion', 'web_search'),
+     'https://perplexity.ai', ''),
+    ('Qwen 72B', 'qwen/qwen-72b-chat',
+     'Large language model from Alibaba with strong multilingual capabilities',
+     '32768', 'Free', 'Alibaba', 'Transformer',
+     ('chat', 'completion', 'multilingual'),
+     'https://qwenlm.com', ''),
+    ('Yi 34B', '01-ai/yi-34b-chat',
+     'High-performance open source model with strong reasoning capabilities',
+     '4096', 'Free', '01.AI', 'Transformer',
+     ('chat', 'completion', 'reasoning'),
+     'https://01.ai', ''),
+    ('DeepSeek-V2', 'deepseek-ai/deepseek-v2',
+     'Advanced reasoning model with strong mathematical capabilities',
+     '16384', '$0.002/1K tokens', 'DeepSeek AI', 'Transformer',
+     ('chat', 'completion', 'reasoning', 'math'),
+     'https://deepseek.ai', ''),
+    ('Code Llama 34B', 'meta-llama/code-llama-34b',
+     'Specialized model for code generation and programming tasks',
+     '16384', 'Free', 'Meta', 'Transformer',
+     ('code', 'completion', 'chat'),
+     'https://ai.meta.com/llama', ''),
+    ('Solar Pro', 'upstage/solar-pro',
+     'Korean-language model with strong multilingual capabilities',
+     '4096', '$0.005/1K tokens', 'Upstage', 'Transformer',
+     ('chat', 'completion', 'multilingual'),
+     'https://upstage.ai', ''),
+    ('Nexus Raven', 'nexus-stream/nexus-raven',
+     'Specialized model for function calling and tool use',
+     '4096', 'Free', 'Nexus Flow', 'Transformer',
+     ('chat', 'completion', 'function_calling'),
+     'https://nexusflow.ai', ''),
+    ('Phi-2', 'microsoft/phi-2',
+     'Small but capable model from Microsoft, good for local deployment',
+     '2048', 'Free', 'Microsoft', 'Transformer',
+     ('chat', 'completion'),
+     'https://azure.microsoft.com', ''),
+)
 
 def categorize_model(pricing_info):
     """Categorize model based on pricing information"""
     if not pricing_info:
         return 'Unknown'
     
-    pricing_str = str(pricing_info).lower()
+    pricing_str = pricing_info if isinstance(pricing_info, str) else str(pricing_info)
     
     # Check for free indicators
-    if any(keyword in pricing_str for keyword in ['free', '0.00', 'no cost', 'gratis', 'open source']):
+    if _FREE_RE.search(pricing_str):
         return 'Free'
     
     # Check for paid indicators
-    if any(keyword in pricing_str for keyword in ['$', 'paid', 'premium', 'subscribe', 'credit']):
+    if _PAID_RE.search(pricing_str):
         return 'Paid'
     
     return 'Unknown'
 
+# The catalog transposed to CSV-ready columns once at import: category is
+# derived from pricing and capabilities are joined into a string
+_MODEL_COLUMNS = dict(zip(SAMPLE_FIELDS, zip(*_MODELS)))
+_MODEL_COLUMNS['category'] = tuple(categorize_model(pricing) for pricing in _MODEL_COLUMNS['pricing'])
+_MODEL_COLUMNS['capabilities'] = tuple(', '.join(caps) for caps in _MODEL_COLUMNS['capabilities'])
+
+def create_sample_models():
+    """Return the sample dataset of LLM models as CSV-ready columns (field -> tuple)"""
+    return dict(_MODEL_COLUMNS)
+
+def catalog_digest():
+    """SHA-256 of the CSV-ready sample columns, in CSV layout"""
+    rows = [(field, _MODEL_COLUMNS[field]) for field in CSV_FIELDS]
+    return hashlib.sha256(repr(rows).encode('utf-8')).hexdigest()
+
+def csv_is_current(digest):
+    """Check the CSV was written from this catalog and not replaced since (e.g. by the scraper)"""
+    try:
+        if os.path.getmtime(CSV_FILE) > os.path.getmtime(DIGEST_FILE):
+            return False
+        with open(DIGEST_FILE, encoding='utf-8') as f:
+            return f.read().strip() == digest
+    except OSError:
+        return False
+
 def main():
     """Main function to create sample data"""
     print("Creating sample LLM model data...")
     
-    # Get sample models
-    models = create_sample_models()
+    digest = catalog_digest()
+    if csv_is_current(digest):
+        print(f"✅ {CSV_FILE} is already up to date")
+        return True
     
-    # Categorize models
-    for model in models:
-        model['category'] = categorize_model(model['pricing'])
-    
-    # Convert capabilities list to string for CSV
-    for model in models:
-        if isinstance(model['capabilities'], list):
-            model['capabilities'] = ', '.join(model['capabilities'])
+    # Get sample models
+    columns = create_sample_models()
+    model_count = len(columns['name'])
     
     # Save to CSV
     try:
-        with open('openrouter_models.csv', 'w', newline='', encoding='utf-8') as csvfile:
-            fieldnames = ['name', 'id', 'description', 'pricing', 'provider', 'category', 'context_length', 'architecture', 'capabilities', 'website', 'image_url']
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(models)
-        
-        print(f"✅ Successfully created openrouter_models.csv with {len(models)} models")
-        
-        # Show summary
-        free_count = len([m for m in models if m['category'] == 'Free'])
-        paid_count = len([m for m in models if m['category'] == 'Paid'])
-        unknown_count = len([m for m in models if m['category'] == 'Unknown'])
+        with open(CSV_FILE, 'w', newline='', encoding='utf-8', buffering=1 << 16) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(CSV_FIELDS)
+            writer.writerows(zip(*[columns[field] for field in CSV_FIELDS]))
         
-        print(f"\n📊 Model Summary:")
-        print(f"   Total models: {len(models)}")
-        print(f"   Free models: {free_count}")
-        print(f"   Paid models: {paid_count}")
-        print(f"   Unknown pricing: {unknown_count}")
+        with open(DIGEST_FILE, 'w', encoding='utf-8') as f:
+            f.write(digest)
         
-        # Show providers
-        providers = list(set(m['provider'] for m in models))
-        print(f"   Providers: {len(providers)} ({', '.join(providers)})")
+        # Show summary in a single write
+        category_counts = Counter(columns['category'])
+        providers = set(columns['provider'])
         
-        print(f"\n🚀 You can now run the Streamlit app!")
-        print(f"   streamlit run app.py")
+        print(
+            f"✅ Successfully created openrouter_models.csv with {model_count} models\n"
+            f"\n📊 Model Summary:\n"
+            f"   Total models: {model_count}\n"
+            f"   Free models: {category_counts['Free']}\n"
+            f"   Paid models: {category_counts['Paid']}\n"
+            f"   Unknown pricing: {category_counts['Unknown']}\n"
+            f"   Providers: {len(providers)} ({', '.join(sorted(providers))})\n"
+            f"\n🚀 You can now run the Streamlit app!\n"
+            f"   streamlit run app.py"
+        )
         
     except Exception as e:
         print(f"❌ Error creating CSV file: {e}")
@@ -4,9 +4,12 @@ Quick test script to run the enhanced scraper and display URL results.
 """
 
 import json
-from scrape_models import scrape_openrouter_models
+import os
 
 def main():
+    # Imported here so importing this module doesn't pull in the scraper stack
+    from scrape_models import scrape_openrouter_models
+    
     print("=== Enhanced OpenRouter Model Scraper Test ===\n")
     
     # Run the scraper
@@ -15,14 +18,23 @@ def main():
     
     print(f"\nSuccessfully scraped {len(models)} models!\n")
     
-    # Display URL statistics
-    models_with_urls = sum(1 for model in models if model.get('model_url'))
-    providers_with_urls = sum(1 for model in models if model.get('provider_url'))
+    # Collect URL statistics and the first models missing a URL in one pass
+    models_with_urls = providers_with_urls = 0
+    models_without_urls = []
+    for model in models:
+        model_url = model.get('model_url')
+        models_with_urls += bool(model_url)
+        providers_with_urls += bool(model.get('provider_url'))
+        if not model_url and len(models_without_urls) < 3:
+            models_without_urls.append(model)
     
-    print("=== URL Coverage Statistics ===")
-    print(f"Total models: {len(models)}")
-    print(f"Models with URLs: {models_with_urls} ({models_with_urls/len(models)*100:.1f}%)")
-    print(f"Providers with URLs: {providers_with_urls} ({providers_with_urls/len(models)*100:.1f}%)")
+    # Display URL statistics
+    print(
+        "=== URL Coverage Statistics ===\n"
+        f"Total models: {len(models)}\n"
+        f"Models with URLs: {models_with_urls} ({models_with_urls/len(models)*100:.1f}%)\n"
+        f"Providers with URLs: {providers_with_urls} ({providers_with_urls/len(models)*100:.1f}%)"
+    )
     
     # Show sample results with URLs
     print("\n=== Sample Models with URLs ===")
@@ -35,17 +47,21 @@ def main():
             print(f"   Description: {model.get('description', '')[:100]}...")
     
     # Show models without URLs for debugging
-    models_without_urls = [model for model in models if not model.get('model_url')]
     if models_without_urls:
         print(f"\n=== Models Without URLs (first 3 for debugging) ===")
-        for i, model in enumerate(models_without_urls[:3]):
-            print(f"\n{i+1}. {model.get('name', 'Unknown name')}")
-            print(f"   Provider: {model.get('provider', 'Unknown provider')}")
-            print(f"   Raw text section: {model.get('raw_text_section', '')[:200]}...")
-    
-    # Save results
-    with open('enhanced_scraped_models.json', 'w') as f:
-        json.dump(models, f, indent=2)
+        print(''.join(
+            f"\n{i+1}. {model.get('name', 'Unknown name')}\n"
+            f"   Provider: {model.get('provider', 'Unknown provider')}\n"
+            f"   Raw text section: {model.get('raw_text_section', '')[:200]}...\n"
+            for i, model in enumerate(models_without_urls)
+        ), end='')
+    
+    # Save results (compact; set PRETTY_JSON=1 for indented output)
+    with open('enhanced_scraped_models.json', 'w', encoding='utf-8', buffering=1 << 20) as f:
+        if os.environ.get('PRETTY_JSON'):
+            json.dump(models, f, indent=2, ensure_ascii=False)
+        else:
+            json.dump(models, f, ensure_ascii=False, separators=(',', ':'))
     
     print(f"\nResults saved to enhanced_scraped_models.json")
     print("\nTest completed! You can now drill down into model details using the provided URLs.")
@@ -1,16 +1,146 @@
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import pandas as pd
+import numpy as np
 import json
 import time
 import re
-from urllib.parse import urljoin, urlparse
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta, timezone
+
+try:
+    from requests_cache import CachedSession
+except ImportError:
+    CachedSession = None
+
+# orjson parses the (often multi-MB) Next.js payload several times faster;
+# its JSONDecodeError subclasses json.JSONDecodeError
+try:
+    import orjson
+    _json_loads = orjson.loads
+except ImportError:
+    orjson = None
+    _json_loads = json.loads
 
 # Set up logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Shared HTTP session: keep-alive connection pool plus retries on throttling/server errors.
+# With requests-cache installed, GET responses are also cached on disk for an hour
+# (and missing API endpoints for a minute, see fetch_api_endpoint).
+# Requests must not send Cache-Control: max-age=0, which requests-cache treats as a forced refresh.
+if CachedSession is not None:
+    _SESSION = CachedSession(
+        'openrouter_cache',
+        backend='sqlite',
+        expire_after=3600,
+        cache_control=True,
+        allowable_methods=('GET',)
+    )
+else:
+    _SESSION = requests.Session()
+_SESSION.mount('https://', HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=8,
+    max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504])
+))
+_NOT_FOUND_EXPIRE_AFTER = timedelta(seconds=60)
+
+# Patterns used while extracting models, compiled once at import
+_SCRIPT_MODELS_JSON_RE = re.compile(r'\{.*"models".*\}', re.DOTALL)
+_NEXT_DATA_BYTES_RE = re.compile(rb'<script[^>]*\bid="__NEXT_DATA__"[^>]*>(.*?)</script>', re.DOTALL)
+_MODEL_CONTAINER_CLASS_RE = re.compile(r'model|card|item|entry', re.I)
+# Substrings that mark a link or text section as model-related
+_MODEL_KEYWORDS_RE = re.compile(
+    r'gpt|claude|llama|mistral|gemini|mixtral|qwen|yi|cohere|perplexity|deepseek|phi|'
+    r'solar|nexus|command|turbo|ultra|pro',
+    re.I
+)
+
+# Container extraction
+_CONTAINER_NAME_RES = [
+    re.compile(r'([A-Z][a-zA-Z\s]*(?:GPT|Claude|Llama|Mistral|Gemini|Mixtral|Qwen|Yi|Cohere|Perplexity|DeepSeek|Phi|Solar|Nexus|Command)[\s\d\w]*)'),
+    re.compile(r'([A-Z][a-zA-Z\s]*(?:Turbo|Ultra|Pro|Chat|Instruct)[\s\d\w]*)')
+]
+_TOKEN_COUNT_RE = re.compile(r'(\d+[KM]?)\s*tokens?', re.I)
+_CATEGORY_RE = re.compile(r'([#★]\d*\s*[A-Za-z\s]+)')
+_BARE_COUNT_RE = re.compile(r'^\d+[KM]?$')
+_PROVIDER_RE = re.compile(r'by\s+([A-Za-z\s&]+)')
+_CONTEXT_RE = re.compile(r'(\d+[K]?)\s*context', re.I)
+_INPUT_PRICE_RE = re.compile(r'\$([\d.]+)\s*\/?[M]\s*input', re.I)
+_OUTPUT_PRICE_RE = re.compile(r'\$([\d.]+)\s*\/?[M]\s*output', re.I)
+_IMAGE_PRICE_RE = re.compile(r'\$([\d.]+)\s*\/?[K]\s*image', re.I)
+
+# Text section extraction (name patterns are tried in order)
+_TEXT_NAME_RES = [re.compile(pattern) for pattern in [
+    r'(GPT-\d+(?:\.\d+)?\s*(?:Turbo|Pro)?)',
+    r'(Claude\s+\d+(?:\.\d+)?\s*(?:Sonnet|Opus|Haiku)?)',
+    r'(Gemini\s+\d+(?:\.\d+)?\s*(?:Pro)?)',
+    r'(Llama\s+\d+\s*[Bb]?)',
+    r'(Mistral\s+\d+[Bb]?)',
+    r'(Kimi\s+Dev\s+\d+[Bb]?)',
+    r'(OpenAI\s+o\d+\s*(?:Pro)?)',
+    r'([A-Z][a-zA-Z\s\d]*?(?:GPT|Claude|Llama|Mistral|Gemini|Mixtral|Qwen|Yi|Cohere|Perplexity|DeepSeek|Phi|Solar|Nexus|Command|OpenAI|Kimi)[\s\d\w().]*)',
+    r'([A-Z][a-zA-Z\s\d]*?(?:Turbo|Ultra|Pro|Dev|Chat|Instruct)[\s\d\w().]*)',
+    r'([A-Z][a-zA-Z\s\d]+?\d+[Bb]?)',
+    r'([A-Z][a-zA-Z\s\d]+?\s*\d+(?:\.\d+)?[Bb]?)',
+    r'([A-Z][a-zA-Z\s\d]+(?:\s+\d+)?[Bb]?)'  # More flexible pattern
+]]
+# Keywords an extracted text-section name must contain (unless it ends with a size)
+_NAME_KEYWORDS_RE = re.compile(
+    r'gpt|claude|llama|mistral|gemini|mixtral|qwen|yi|cohere|perplexity|deepseek|phi|'
+    r'solar|nexus|command|openai|kimi|turbo|ultra|pro|dev|chat|instruct',
+    re.I
+)
+_FREE_SUFFIX_RE = re.compile(r'\s*\(\s*free\s*\)')
+_CONTEXT_SUFFIX_RE = re.compile(r'\s*\(\d+K\)')
+_PAREN_NUMBER_RE = re.compile(r'\s*\(\d+\)')
+_SIZE_SUFFIX_RE = re.compile(r'\d+[Bb]?$')
+_WHITESPACE_RE = re.compile(r'\s+')
+_COMPANY_RES = [re.compile(pattern) for pattern in [
+    r'(OpenAI)',
+    r'(Google)',
+    r'(Anthropic)',
+    r'(Meta)',
+    r'(Microsoft)',
+    r'(Cohere)',
+    r'(Mistral AI)',
+    r'(Perplexity AI)',
+    r'(DeepSeek AI)',
+    r'(Alibaba)',
+    r'(01\.AI)',
+    r'(Upstage)',
+    r'(Nexus Flow)',
+    r'(Moonshot)'
+]]
+_TEXT_CONTEXT_RE = re.compile(r'(\d+[K]?)\s*context')
+_PRICE_RE = re.compile(r'\$([\d.]+)')
+_NON_SLUG_RE = re.compile(r'[^\w\s-]')
+
+# Fields filled from a container's pipe-delimited provider/context/pricing line
+_PIPE_FIELDS = ('provider', 'provider_url', 'context_length', 'input_price', 'output_price', 'image_price')
+
+# Pricing keywords used to categorize models
+_FREE_PATTERN = r'free|0\.00|no cost|gratis|open source'
+_PAID_PATTERN = r'\$|paid|premium|subscribe|credit|token'
+
+def _absurl(href, base='https://openrouter.ai'):
+    """
+    Resolve an href from the OpenRouter page against the site root
+    Hrefs there are absolute or root-relative, so a prefix check replaces urljoin
+    """
+    if href.startswith(('http:', 'https:')):
+        return href
+    if href.startswith('//'):
+        return 'https:' + href
+    if not href:
+        return base
+    return base + (href if href.startswith('/') else '/' + href)
+
 def scrape_openrouter_models():
     """
     Scrape model information from OpenRouter.ai models page
@@ -30,81 +160,21 @@ def scrape_openrouter_models():
         'Sec-Fetch-Mode': 'navigate',
         'Sec-Fetch-Site': 'none',
         'Sec-Fetch-User': '?1',
-        'Cache-Control': 'max-age=0',
     }
     
     try:
-        # Fetch the main models page
-        url = "https://openrouter.ai/models"
-        logger.info(f"Fetching URL: {url}")
-        
-        response = requests.get(url, headers=headers, timeout=30)
-        response.raise_for_status()
-        
-        logger.info(f"Response status: {response.status_code}")
-        logger.info(f"Response length: {len(response.content)}")
-        
-        soup = BeautifulSoup(response.content, 'html.parser')
-        
-        # Debug: Save HTML for inspection
-        with open('debug_page.html', 'w', encoding='utf-8') as f:
-            f.write(soup.prettify())
-        logger.info("Saved debug HTML to debug_page.html")
-        
         models_data = []
         
-        # Method 1: Try to find JSON data in script tags
-        logger.info("Method 1: Looking for JSON data in script tags...")
-        script_tags = soup.find_all('script')
-        logger.info(f"Found {len(script_tags)} script tags")
-        
-        for i, script in enumerate(script_tags):
-            if script.string:
-                # Look for various JSON patterns
-                if '__NEXT_DATA__' in script.string:
-                    logger.info(f"Found __NEXT_DATA__ in script tag {i}")
-                    try:
-                        json_data = json.loads(script.string)
-                        extracted_models = extract_models_from_next_data(json_data)
-                        if extracted_models:
-                            models_data.extend(extracted_models)
-                            logger.info(f"Extracted {len(extracted_models)} models from __NEXT_DATA__")
-                            break
-                    except json.JSONDecodeError as e:
-                        logger.error(f"Failed to parse __NEXT_DATA__: {e}")
-                        continue
-                
-                # Look for other potential JSON data
-                elif 'models' in script.string.lower() and '{' in script.string:
-                    logger.info(f"Found potential models data in script tag {i}")
-                    try:
-                        # Try to extract JSON from the script
-                        json_match = re.search(r'\{.*"models".*\}', script.string, re.DOTALL)
-                        if json_match:
-                            json_data = json.loads(json_match.group())
-                            extracted_models = extract_models_from_json_object(json_data)
-                            if extracted_models:
-                                models_data.extend(extracted_models)
-                                logger.info(f"Extracted {len(extracted_models)} models from script JSON")
-                    except (json.JSONDecodeError, AttributeError) as e:
-                        logger.error(f"Failed to parse script JSON: {e}")
-                        continue
-        
-        # Method 2: If no JSON data found, use the new HTML parsing based on actual structure
-        if not models_data:
-            logger.info("Method 2: Using new HTML parsing based on actual structure...")
-            extracted_models = extract_models_from_html_structure(soup)
-            if extracted_models:
-                models_data.extend(extracted_models)
-                logger.info(f"Extracted {len(extracted_models)} models from HTML structure")
+        # Method 1: Try the JSON API first; it is far cheaper than parsing the HTML page
+        logger.info("Method 1: Trying API endpoint...")
+        extracted_models = extract_models_from_api(headers)
+        if extracted_models:
+            models_data.extend(extracted_models)
+            logger.info(f"Extracted {len(extracted_models)} models from API")
         
-        # Method 3: Try API endpoint if available
+        # Methods 2-3: Fall back to scraping the models page
         if not models_data:
-            logger.info("Method 3: Trying API endpoint...")
-            extracted_models = extract_models_from_api(headers)
-            if extracted_models:
-                models_data.extend(extracted_models)
-                logger.info(f"Extracted {len(extracted_models)} models from API")
+            models_data.extend(extract_models_from_page(headers))
         
         # Method 4: Fallback to sample data if nothing works
         if not models_data:
@@ -127,6 +197,13 @@ def scrape_openrouter_models():
         df.to_csv('openrouter_models.csv', index=False)
         print(f"Successfully scraped {len(df)} models and saved to openrouter_models.csv")
         
+        # Save a Parquet copy for faster loading in the app (needs pyarrow)
+        try:
+            df.to_parquet('openrouter_models.parquet', index=False, compression='zstd')
+            logger.info("Saved Parquet copy to openrouter_models.parquet")
+        except (ImportError, TypeError, ValueError) as e:
+            logger.warning(f"Skipping Parquet output: {e}")
+        
         return df
         
     except Exception as e:
@@ -134,6 +211,91 @@ def scrape_openrouter_models():
         print(f"Error scraping models: {e}")
         return None
 
+def extract_models_from_page(headers):
+    """
+    Fetch the OpenRouter.ai models page and extract models from its script JSON or HTML
+    """
+    # Fetch the main models page
+    url = "https://openrouter.ai/models"
+    logger.info(f"Fetching URL: {url}")
+    
+    response = _SESSION.get(url, headers=headers, timeout=30)
+    response.raise_for_status()
+    
+    logger.info(f"Response status: {response.status_code}")
+    logger.info(f"Response length: {len(response.content)}")
+    
+    # Debug: Save HTML for inspection (raw bytes, no re-serialization)
+    if logger.isEnabledFor(logging.DEBUG):
+        with open('debug_page.html', 'wb') as f:
+            f.write(response.content)
+        logger.debug("Saved debug HTML to debug_page.html")
+    
+    # Method 2: Try to find JSON data in script tags
+    logger.info("Method 2: Looking for JSON data in script tags...")
+    
+    # Happy path: pull __NEXT_DATA__ straight out of the raw bytes and skip the HTML parse
+    if b'__NEXT_DATA__' in response.content:
+        next_data_match = _NEXT_DATA_BYTES_RE.search(response.content)
+        if next_data_match:
+            try:
+                extracted_models = extract_models_from_next_data(_json_loads(next_data_match.group(1)))
+                if extracted_models:
+                    logger.info(f"Extracted {len(extracted_models)} models from raw __NEXT_DATA__")
+                    return extracted_models
+            except json.JSONDecodeError as e:
+                logger.warning(f"Failed to parse raw __NEXT_DATA__: {e}")
+    
+    soup = BeautifulSoup(response.content, 'lxml')
+    models_data = []
+    
+    # Next.js always renders its page data as <script id="__NEXT_DATA__">
+    next_data_script = soup.find('script', id='__NEXT_DATA__')
+    if next_data_script is not None and next_data_script.string:
+        logger.info("Found __NEXT_DATA__ script tag")
+        try:
+            json_data = _json_loads(str(next_data_script.string))
+            extracted_models = extract_models_from_next_data(json_data)
+            if extracted_models:
+                models_data.extend(extracted_models)
+                logger.info(f"Extracted {len(extracted_models)} models from __NEXT_DATA__")
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse __NEXT_DATA__: {e}")
+    
+    # Otherwise scan the remaining script tags for other potential JSON data
+    if not models_data:
+        script_tags = soup.find_all('script')
+        logger.info(f"Found {len(script_tags)} script tags")
+        
+        for i, script in enumerate(script_tags):
+            if script is next_data_script or not script.string:
+                continue
+            
+            if 'models' in script.string.lower():
+                logger.info(f"Found potential models data in script tag {i}")
+                try:
+                    # Try to extract JSON from the script
+                    json_match = _SCRIPT_MODELS_JSON_RE.search(script.string)
+                    if json_match:
+                        json_data = _json_loads(json_match.group())
+                        extracted_models = extract_models_from_json_object(json_data)
+                        if extracted_models:
+                            models_data.extend(extracted_models)
+                            logger.info(f"Extracted {len(extracted_models)} models from script JSON")
+                except (json.JSONDecodeError, AttributeError) as e:
+                    logger.error(f"Failed to parse script JSON: {e}")
+                    continue
+    
+    # Method 3: If no JSON data found, use the new HTML parsing based on actual structure
+    if not models_data:
+        logger.info("Method 3: Using new HTML parsing based on actual structure...")
+        extracted_models = extract_models_from_html_structure(soup)
+        if extracted_models:
+            models_data.extend(extracted_models)
+            logger.info(f"Extracted {len(extracted_models)} models from HTML structure")
+    
+    return models_data
+
 def extract_models_from_next_data(json_data):
     """
     Extract model information from Next.js JSON data
@@ -143,9 +305,10 @@ def extract_models_from_next_data(json_data):
     
     try:
         # Save the full JSON for debugging
-        with open('debug_next_data.json', 'w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
-        logger.info("Saved debug Next.js data to debug_next_data.json")
+        if logger.isEnabledFor(logging.DEBUG):
+            with open('debug_next_data.json', 'w', encoding='utf-8') as f:
+                json.dump(json_data, f)
+            logger.debug("Saved debug Next.js data to debug_next_data.json")
         
         # Navigate through the JSON structure to find models
         # This is a common pattern in Next.js apps
@@ -222,6 +385,41 @@ def extract_models_from_json_object(json_data):
     
     return models
 
+def fetch_api_endpoint(endpoint, headers):
+    """
+    Fetch one API endpoint; return its models, or None if it has no usable model list
+    """
+    logger.info(f"Trying API endpoint: {endpoint}")
+    response = _SESSION.get(endpoint, headers=headers, timeout=10)
+    if response.status_code != 200:
+        # Remember a missing endpoint briefly so quick reruns skip it
+        if (response.status_code == 404 and CachedSession is not None and
+                not getattr(response, 'from_cache', False)):
+            _SESSION.cache.save_response(response, expires=datetime.now(timezone.utc) + _NOT_FOUND_EXPIRE_AFTER)
+        return None
+    
+    data = _json_loads(response.content)
+    if 'data' not in data or not isinstance(data['data'], list):
+        return None
+    
+    models = []
+    for item in data['data']:
+        if isinstance(item, dict):
+            model_info = {
+                'name': item.get('name', item.get('id', '')),
+                'id': item.get('id', ''),
+                'description': item.get('description', ''),
+                'context_length': str(item.get('context_length', '')),
+                'pricing': item.get('pricing', ''),
+                'provider': item.get('owned_by', ''),
+                'architecture': '',
+                'capabilities': [],
+                'website': '',
+                'image_url': ''
+            }
+            models.append(model_info)
+    return models
+
 def extract_models_from_api(headers):
     """
     Try to extract models from API endpoint
@@ -236,33 +434,26 @@ def extract_models_from_api(headers):
             'https://openrouter.ai/api/models'
         ]
         
-        for endpoint in api_endpoints:
-            try:
-                logger.info(f"Trying API endpoint: {endpoint}")
-                response = requests.get(endpoint, headers=headers, timeout=10)
-                if response.status_code == 200:
-                    data = response.json()
-                    if 'data' in data and isinstance(data['data'], list):
-                        for item in data['data']:
-                            if isinstance(item, dict):
-                                model_info = {
-                                    'name': item.get('name', item.get('id', '')),
-                                    'id': item.get('id', ''),
-                                    'description': item.get('description', ''),
-                                    'context_length': str(item.get('context_length', '')),
-                                    'pricing': item.get('pricing', ''),
-                                    'provider': item.get('owned_by', ''),
-                                    'architecture': '',
-                                    'capabilities': [],
-                                    'website': '',
-                                    'image_url': ''
-                                }
-                                models.append(model_info)
-                        logger.info(f"Extracted {len(models)} models from API endpoint: {endpoint}")
-                        break
-            except Exception as e:
-                logger.warning(f"Failed to fetch from {endpoint}: {e}")
-                continue
+        # Probe all endpoints at once so a dead one costs its timeout only once;
+        # the first endpoint in list order with a model list wins, and the
+        # remaining probes are abandoned rather than waited for
+        executor = ThreadPoolExecutor(max_workers=len(api_endpoints))
+        try:
+            futures = [executor.submit(fetch_api_endpoint, endpoint, headers) for endpoint in api_endpoints]
+            
+            for endpoint, future in zip(api_endpoints, futures):
+                try:
+                    result = future.result()
+                except Exception as e:
+                    logger.warning(f"Failed to fetch from {endpoint}: {e}")
+                    continue
+                
+                if result is not None:
+                    models = result
+                    logger.info(f"Extracted {len(models)} models from API endpoint: {endpoint}")
+                    break
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
                 
     except Exception as e:
         logger.error(f"Error extracting from API: {e}")
@@ -339,25 +530,27 @@ def get_sample_models():
 
 def find_models_in_dict(data, max_depth=10):
     """
-    Recursively search for models in dictionary
+    Depth-first search for models in dictionary, using an explicit stack
     """
-    if max_depth <= 0:
-        return None
+    stack = [(data, 0)]
     
-    if isinstance(data, dict):
-        if 'models' in data:
-            return data['models']
+    while stack:
+        node, depth = stack.pop()
+        if depth >= max_depth:
+            continue
         
-        for key, value in data.items():
-            result = find_models_in_dict(value, max_depth - 1)
-            if result:
-                return result
-    
-    elif isinstance(data, list):
-        for item in data:
-            result = find_models_in_dict(item, max_depth - 1)
-            if result:
-                return result
+        # JSON decoders only produce plain dicts and lists
+        if type(node) is dict:
+            if 'models' in node:
+                # An empty 'models' entry ends this branch, as before
+                if node['models']:
+                    return node['models']
+                continue
+            # Push in reverse so children are visited in document order
+            stack.extend((value, depth + 1) for value in reversed(node.values()))
+        
+        elif type(node) is list:
+            stack.extend((item, depth + 1) for item in reversed(node))
     
     return None
 
@@ -389,6 +582,7 @@ def extract_models_from_html_structure(soup):
     """
     models = []
     failed_extractions = 0
+    skipped_containers = 0
     logger.info("Extracting models from HTML structure based on actual layout...")
     
     # Look for model containers - these could be divs, articles, or sections
@@ -399,47 +593,43 @@ def extract_models_from_html_structure(soup):
     logger.info(f"Found {len(model_links)} links total")
     
     # Filter links that might be model names (look for patterns)
-    model_patterns = [
-        r'gpt', r'claude', r'llama', r'mistral', r'gemini', r'mixtral',
-        r'qwen', r'yi', r'cohere', r'perplexity', r'deepseek', r'phi',
-        r'solar', r'nexus', r'command', r'turbo', r'ultra', r'pro'
-    ]
-    
     potential_model_links = []
     for link in model_links:
-        href = link.get('href', '').lower()
-        text = link.get_text(strip=True).lower()
-        
         # Check if link or text contains model patterns
-        if any(pattern in href or pattern in text for pattern in model_patterns):
+        if (_MODEL_KEYWORDS_RE.search(link.get('href', '')) or
+                _MODEL_KEYWORDS_RE.search(link.get_text(strip=True))):
             potential_model_links.append(link)
     
     logger.info(f"Found {len(potential_model_links)} potential model links")
     
     # Strategy 2: Look for sections or divs that might contain model information
     # Look for common container patterns
-    containers = soup.find_all(['div', 'section', 'article'], class_=re.compile(r'model|card|item|entry', re.I))
+    containers = soup.find_all(['div', 'section', 'article'], class_=_MODEL_CONTAINER_CLASS_RE)
     logger.info(f"Found {len(containers)} potential model containers")
     
-    # Also look for elements that might contain the structured data
-    # Since we know the structure has specific items separated by |, look for that pattern
-    text_elements = soup.find_all(['div', 'span', 'p'])
-    
     for i, container in enumerate(containers):
+        # Walk the container's subtree once; the text is reused for logging
+        raw_text = container.get_text()
+        
+        # Cheap prefilter: the loose class match picks up many non-model cards,
+        # so require a model keyword plus a price or context mention
+        if (not _MODEL_KEYWORDS_RE.search(raw_text) or
+                ('$' not in raw_text and 'context' not in raw_text.lower())):
+            skipped_containers += 1
+            continue
+        
         try:
-            model_info = extract_model_from_container(container, soup)
+            model_info = extract_model_from_container(container, raw_text)
             if model_info and model_info.get('name'):
                 models.append(model_info)
                 logger.debug(f"Added model from container {i}: {model_info['name']}")
             else:
                 # Log failed extraction
-                raw_text = container.get_text()
                 log_failed_extraction(raw_text, f"container_{i}", "No model name extracted")
                 failed_extractions += 1
         except Exception as e:
             logger.warning(f"Error extracting model from container {i}: {e}")
             # Log failed extraction
-            raw_text = container.get_text()
             log_failed_extraction(raw_text, f"container_{i}", str(e))
             failed_extractions += 1
             continue
@@ -454,7 +644,7 @@ def extract_models_from_html_structure(soup):
         text_sections = all_text.split('\n')
         
         for section in text_sections:
-            if '|' in section and any(pattern in section.lower() for pattern in model_patterns):
+            if '|' in section and _MODEL_KEYWORDS_RE.search(section):
                 try:
                     model_info = extract_model_from_text_section(section)
                     if model_info and model_info.get('name'):
@@ -471,6 +661,7 @@ def extract_models_from_html_structure(soup):
                     failed_extractions += 1
     
     logger.info(f"Extracted {len(models)} models from HTML structure")
+    logger.info(f"Skipped containers: {skipped_containers}")
     logger.info(f"Failed extractions: {failed_extractions}")
     
     # If we have too many failed extractions, log a warning
@@ -479,17 +670,26 @@ def extract_models_from_html_structure(soup):
     
     return models
 
-def extract_model_from_container(container, soup):
+def extract_model_from_container(container, text=None):
     """
     Extract model information from a single container element
+    `text` is the container's get_text(), when the caller already has it
     """
     model_info = {}
-    raw_text = container.get_text()  # Save raw text for logging
+    if text is None:
+        text = container.get_text()
+    raw_text = text  # Save raw text for logging
     
     try:
-        # Get all text and links in this container
+        # Get all links in this container
         links = container.find_all('a', href=True)
-        text = container.get_text()
+        
+        # Lowercased link text -> first link with that text, for provider lookups
+        link_map = {}
+        for link in links:
+            link_text = link.get_text(strip=True)
+            if link_text:
+                link_map.setdefault(link_text.lower(), link)
         
         # Item 1: Extract model name and token counts
         # Model name is usually the most prominent link
@@ -504,35 +704,30 @@ def extract_model_from_container(container, soup):
             
             if model_link:
                 model_info['name'] = model_link.get_text(strip=True)
-                model_info['model_url'] = urljoin('https://openrouter.ai', model_link.get('href', ''))
+                model_info['model_url'] = _absurl(model_link.get('href', ''))
         
         # If no model name found in links, try to extract from text
         if 'name' not in model_info:
             # Look for model name patterns in text
-            model_patterns = [
-                r'([A-Z][a-zA-Z\s]*(?:GPT|Claude|Llama|Mistral|Gemini|Mixtral|Qwen|Yi|Cohere|Perplexity|DeepSeek|Phi|Solar|Nexus|Command)[\s\d\w]*)',
-                r'([A-Z][a-zA-Z\s]*(?:Turbo|Ultra|Pro|Chat|Instruct)[\s\d\w]*)'
-            ]
-            
-            for pattern in model_patterns:
-                match = re.search(pattern, text)
+            for pattern in _CONTAINER_NAME_RES:
+                match = pattern.search(text)
                 if match:
                     model_info['name'] = match.group(1).strip()
                     break
         
         # Extract token counts (right aligned, usually numbers with K/M)
-        token_match = re.search(r'(\d+[KM]?)\s*tokens?', text, re.I)
+        token_match = _TOKEN_COUNT_RE.search(text)
         if token_match:
             model_info['token_count'] = token_match.group(1)
         
         # Item 2: Extract categories (optional, with ranking)
-        category_match = re.search(r'([#★]\d*\s*[A-Za-z\s]+)', text)
+        category_match = _CATEGORY_RE.search(text)
         if category_match:
             model_info['categories'] = category_match.group(1).strip()
         
         # Item 3: Extract description (long text, often wrapped)
         # Description is usually the longer text content, not including the structured items
-        lines = [line.strip() for line in text.split('\n') if line.strip()]
+        lines = [line for raw_line in text.split('\n') if (line := raw_line.strip())]
         
         # Filter out lines that look like structured data (contain |, $, context, etc.)
         description_lines = []
@@ -542,7 +737,7 @@ def extract_model_from_container(container, soup):
                 '$' not in line and 
                 'context' not in line.lower() and
                 'tokens' not in line.lower() and
-                not re.match(r'^\d+[KM]?$', line)):
+                not _BARE_COUNT_RE.match(line)):
                 description_lines.append(line)
         
         if description_lines:
@@ -552,48 +747,55 @@ def extract_model_from_container(container, soup):
                 model_info['description'] = description
         
         # Items 4-8: Extract structured data separated by |
-        # Look for lines containing the delimiter
-        for line in lines:
-            if '|' in line:
-                parts = [part.strip() for part in line.split('|')]
-                
-                if len(parts) >= 4:  # Should have at least 4 parts
-                    # Part 4: Provider (hyper-linked)
-                    if len(parts) >= 1:
-                        provider_match = re.search(r'by\s+([A-Za-z\s&]+)', parts[0])
-                        if provider_match:
-                            model_info['provider'] = provider_match.group(1).strip()
-                        
-                        # Look for provider link
-                        for link in links:
-                            link_text = link.get_text(strip=True)
-                            if link_text and link_text.lower() in parts[0].lower():
-                                model_info['provider_url'] = urljoin('https://openrouter.ai', link.get('href', ''))
-                                break
-                    
-                    # Part 5: Context window size
-                    if len(parts) >= 2:
-                        context_match = re.search(r'(\d+[K]?)\s*context', parts[1], re.I)
-                        if context_match:
-                            model_info['context_length'] = context_match.group(1)
-                    
-                    # Part 6: Input token pricing
-                    if len(parts) >= 3:
-                        input_price_match = re.search(r'\$([\d.]+)\s*\/?[M]\s*input', parts[2], re.I)
-                        if input_price_match:
-                            model_info['input_price'] = f"${input_price_match.group(1)}/M input tokens"
-                    
-                    # Part 7: Output token pricing
-                    if len(parts) >= 4:
-                        output_price_match = re.search(r'\$([\d.]+)\s*\/?[M]\s*output', parts[3], re.I)
-                        if output_price_match:
-                            model_info['output_price'] = f"${output_price_match.group(1)}/M output tokens"
-                    
-                    # Part 8: Image pricing (optional)
-                    if len(parts) >= 5:
-                        image_price_match = re.search(r'\$([\d.]+)\s*\/?[K]\s*image', parts[4], re.I)
-                        if image_price_match:
-                            model_info['image_price'] = f"${image_price_match.group(1)}/K input imgs"
+        # Later lines take precedence, so scan them last-first, fill each field
+        # once and stop as soon as every field is known
+        for line in reversed(lines):
+            if all(field in model_info for field in _PIPE_FIELDS):
+                break
+            if '|' not in line:
+                continue
+            
+            parts = [part.strip() for part in line.split('|')]
+            if len(parts) < 4:  # Should have at least 4 parts
+                continue
+            
+            # Part 4: Provider (hyper-linked)
+            if 'provider' not in model_info:
+                provider_match = _PROVIDER_RE.search(parts[0])
+                if provider_match:
+                    model_info['provider'] = provider_match.group(1).strip()
+            
+            # Look for provider link
+            if 'provider_url' not in model_info:
+                provider_part = parts[0].lower()
+                for link_text, link in link_map.items():
+                    if link_text in provider_part:
+                        model_info['provider_url'] = _absurl(link.get('href', ''))
+                        break
+            
+            # Part 5: Context window size
+            if 'context_length' not in model_info:
+                context_match = _CONTEXT_RE.search(parts[1])
+                if context_match:
+                    model_info['context_length'] = context_match.group(1)
+            
+            # Part 6: Input token pricing
+            if 'input_price' not in model_info:
+                input_price_match = _INPUT_PRICE_RE.search(parts[2])
+                if input_price_match:
+                    model_info['input_price'] = f"${input_price_match.group(1)}/M input tokens"
+            
+            # Part 7: Output token pricing
+            if 'output_price' not in model_info:
+                output_price_match = _OUTPUT_PRICE_RE.search(parts[3])
+                if output_price_match:
+                    model_info['output_price'] = f"${output_price_match.group(1)}/M output tokens"
+            
+            # Part 8: Image pricing (optional)
+            if len(parts) >= 5 and 'image_price' not in model_info:
+                image_price_match = _IMAGE_PRICE_RE.search(parts[4])
+                if image_price_match:
+                    model_info['image_price'] = f"${image_price_match.group(1)}/K input imgs"
         
         # Combine pricing information
         pricing_parts = []
@@ -652,38 +854,20 @@ def extract_model_from_text_section(text_section):
         
         # Extract model name from the beginning of the text
         # Use non-greedy patterns and more specific matching
-        model_patterns = [
-            r'(GPT-\d+(?:\.\d+)?\s*(?:Turbo|Pro)?)',
-            r'(Claude\s+\d+(?:\.\d+)?\s*(?:Sonnet|Opus|Haiku)?)',
-            r'(Gemini\s+\d+(?:\.\d+)?\s*(?:Pro)?)',
-            r'(Llama\s+\d+\s*[Bb]?)',
-            r'(Mistral\s+\d+[Bb]?)',
-            r'(Kimi\s+Dev\s+\d+[Bb]?)',
-            r'(OpenAI\s+o\d+\s*(?:Pro)?)',
-            r'([A-Z][a-zA-Z\s\d]*?(?:GPT|Claude|Llama|Mistral|Gemini|Mixtral|Qwen|Yi|Cohere|Perplexity|DeepSeek|Phi|Solar|Nexus|Command|OpenAI|Kimi)[\s\d\w().]*)',
-            r'([A-Z][a-zA-Z\s\d]*?(?:Turbo|Ultra|Pro|Dev|Chat|Instruct)[\s\d\w().]*)',
-            r'([A-Z][a-zA-Z\s\d]+?\d+[Bb]?)',
-            r'([A-Z][a-zA-Z\s\d]+?\s*\d+(?:\.\d+)?[Bb]?)',
-            r'([A-Z][a-zA-Z\s\d]+(?:\s+\d+)?[Bb]?)'  # More flexible pattern
-        ]
-        
-        for pattern in model_patterns:
-            match = re.search(pattern, text_section)
+        for pattern in _TEXT_NAME_RES:
+            match = pattern.search(text_section)
             if match:
                 model_name = match.group(1).strip()
                 # Clean up common artifacts - be more conservative
-                model_name = re.sub(r'\s*\(\s*free\s*\)', '', model_name)
-                model_name = re.sub(r'\s*\(\d+K\)', '', model_name)  # Remove context sizes
-                model_name = re.sub(r'\s*\(\d+\)', '', model_name)  # Remove numbers in parentheses
+                model_name = _FREE_SUFFIX_RE.sub('', model_name)
+                model_name = _CONTEXT_SUFFIX_RE.sub('', model_name)  # Remove context sizes
+                model_name = _PAREN_NUMBER_RE.sub('', model_name)  # Remove numbers in parentheses
                 # Don't modify version numbers like 3.5, keep them as is
                 model_name = model_name.strip()
                 # Additional validation: must contain at least one model-related keyword or number
                 if (model_name and len(model_name) > 2 and 
-                    (any(keyword in model_name.lower() for keyword in 
-                         ['gpt', 'claude', 'llama', 'mistral', 'gemini', 'mixtral', 'qwen', 'yi', 
-                          'cohere', 'perplexity', 'deepseek', 'phi', 'solar', 'nexus', 'command', 
-                          'openai', 'kimi', 'turbo', 'ultra', 'pro', 'dev', 'chat', 'instruct']) or
-                     re.search(r'\d+[Bb]?$', model_name))):  # Ends with number or B/b
+                    (_NAME_KEYWORDS_RE.search(model_name) or
+                     _SIZE_SUFFIX_RE.search(model_name))):  # Ends with number or B/b
                     model_info['name'] = model_name
                     break
         
@@ -696,10 +880,10 @@ def extract_model_from_text_section(text_section):
         provider_found = False
         for part in parts:
             if 'by' in part.lower():
-                provider_match = re.search(r'by\s+([A-Za-z\s&]+)', part)
+                provider_match = _PROVIDER_RE.search(part)
                 if provider_match:
                     provider_name = provider_match.group(1).strip()
-                    provider_name = re.sub(r'\s+', ' ', provider_name)
+                    provider_name = _WHITESPACE_RE.sub(' ', provider_name)
                     model_info['provider'] = provider_name
                     provider_found = True
                     break
@@ -710,25 +894,8 @@ def extract_model_from_text_section(text_section):
             # Only look for provider if the model name was already extracted and is different
             if model_info.get('name') not in first_part:
                 # Look for company names in the first part
-                company_patterns = [
-                    r'(OpenAI)',
-                    r'(Google)',
-                    r'(Anthropic)',
-                    r'(Meta)',
-                    r'(Microsoft)',
-                    r'(Cohere)',
-                    r'(Mistral AI)',
-                    r'(Perplexity AI)',
-                    r'(DeepSeek AI)',
-                    r'(Alibaba)',
-                    r'(01\.AI)',
-                    r'(Upstage)',
-                    r'(Nexus Flow)',
-                    r'(Moonshot)'
-                ]
-                
-                for pattern in company_patterns:
-                    provider_match = re.search(pattern, first_part)
+                for pattern in _COMPANY_RES:
+                    provider_match = pattern.search(first_part)
                     if provider_match:
                         provider_name = provider_match.group(1).strip()
                         model_info['provider'] = provider_name
@@ -740,25 +907,25 @@ def extract_model_from_text_section(text_section):
             
             # Context
             if 'context' in part_lower:
-                context_match = re.search(r'(\d+[K]?)\s*context', part)
+                context_match = _TEXT_CONTEXT_RE.search(part)
                 if context_match:
                     model_info['context_length'] = context_match.group(1)
             
             # Input price
             elif 'input' in part_lower and '$' in part:
-                price_match = re.search(r'\$([\d.]+)', part)
+                price_match = _PRICE_RE.search(part)
                 if price_match:
                     model_info['input_price'] = f"${price_match.group(1)}/M input tokens"
             
             # Output price
             elif 'output' in part_lower and '$' in part:
-                price_match = re.search(r'\$([\d.]+)', part)
+                price_match = _PRICE_RE.search(part)
                 if price_match:
                     model_info['output_price'] = f"${price_match.group(1)}/M output tokens"
             
             # Image price
             elif 'image' in part_lower and '$' in part:
-                price_match = re.search(r'\$([\d.]+)', part)
+                price_match = _PRICE_RE.search(part)
                 if price_match:
                     model_info['image_price'] = f"${price_match.group(1)}/K input imgs"
             
@@ -796,12 +963,12 @@ def extract_model_from_text_section(text_section):
         # Generate URLs based on name and provider if not found
         if not model_info.get('model_url') and model_info.get('name'):
             # Create a URL-friendly name
-            url_name = re.sub(r'[^\w\s-]', '', model_info['name']).strip().replace(' ', '-').lower()
+            url_name = _NON_SLUG_RE.sub('', model_info['name']).strip().replace(' ', '-').lower()
             model_info['model_url'] = f"https://openrouter.ai/{url_name}"
         
         if not model_info.get('provider_url') and model_info.get('provider'):
             # Create a URL-friendly provider name
-            url_provider = re.sub(r'[^\w\s-]', '', model_info['provider']).strip().replace(' ', '-').lower()
+            url_provider = _NON_SLUG_RE.sub('', model_info['provider']).strip().replace(' ', '-').lower()
             model_info['provider_url'] = f"https://openrouter.ai/{url_provider}"
         
         # Validate minimum required information
@@ -920,6 +1087,16 @@ def extract_model_from_element(element):
     
     return model_info if model_info.get('name') else None
 
+def categorize_pricing_dict(pricing):
+    """
+    Categorize API pricing ({'prompt': ..., 'completion': ...}): Free only if both prices are zero
+    """
+    try:
+        is_free = float(pricing.get('prompt')) == 0 and float(pricing.get('completion')) == 0
+    except (TypeError, ValueError):
+        is_free = False
+    return 'Free' if is_free else 'Paid'
+
 def clean_and_categorize_models(df):
     """
     Clean the model data and categorize into free and paid
@@ -937,60 +1114,34 @@ def clean_and_categorize_models(df):
             df[col] = ''
             logger.info(f"Added missing column: {col}")
     
-    # Categorize models based on pricing
-    def categorize_model(pricing_info):
-        if pd.isna(pricing_info) or pricing_info == '':
-            return 'Unknown'
-        
-        pricing_str = str(pricing_info).lower()
-        
-        # Check for free indicators
-        if any(keyword in pricing_str for keyword in ['free', '0.00', 'no cost', 'gratis', 'open source']):
-            return 'Free'
-        
-        # Check for paid indicators
-        if any(keyword in pricing_str for keyword in ['$', 'paid', 'premium', 'subscribe', 'credit', 'token']):
-            return 'Paid'
-        
-        return 'Unknown'
+    # Categorize models based on pricing (missing pricing stays Unknown)
+    pricing = df['pricing']
+    is_dict = pricing.map(type).eq(dict)
+    pricing_str = pricing.where(pricing.notna(), '').astype(str).str.lower()
+    free_mask = pricing_str.str.contains(_FREE_PATTERN, regex=True)
+    paid_mask = pricing_str.str.contains(_PAID_PATTERN, regex=True)
+    df['category'] = np.select([free_mask, paid_mask], ['Free', 'Paid'], default='Unknown')
+    # API pricing dicts hold per-token prices like '0.0000025', which the keyword
+    # match would call Free, so categorize them by value instead
+    df.loc[is_dict, 'category'] = pricing[is_dict].map(categorize_pricing_dict)
+    category_counts = df['category'].value_counts()
+    logger.info(f"Categorized models: Free={category_counts.get('Free', 0)}, Paid={category_counts.get('Paid', 0)}, Unknown={category_counts.get('Unknown', 0)}")
     
-    # Apply categorization
-    df['category'] = df['pricing'].apply(categorize_model)
-    logger.info(f"Categorized models: Free={len(df[df['category'] == 'Free'])}, Paid={len(df[df['category'] == 'Paid'])}, Unknown={len(df[df['category'] == 'Unknown'])}")
+    # Clean up pricing information: serialize dicts, stringify the rest
+    df['pricing'] = pricing.where(pricing.notna(), '').astype(str)
+    df.loc[is_dict, 'pricing'] = pricing[is_dict].map(json.dumps)
     
-    # Clean up pricing information
-    def clean_pricing(pricing_info):
-        if pd.isna(pricing_info):
-            return ''
-        
-        if isinstance(pricing_info, dict):
-            return json.dumps(pricing_info)
-        
-        return str(pricing_info)
-    
-    df['pricing'] = df['pricing'].apply(clean_pricing)
-    
-    # Clean up URLs
-    def clean_url(url):
-        if pd.isna(url) or url == '':
-            return ''
-        
-        url_str = str(url).strip()
-        
-        # Ensure URL starts with http
-        if url_str and not url_str.startswith(('http://', 'https://')):
-            url_str = f"https://openrouter.ai/{url_str.lstrip('/')}"
-        
-        return url_str
-    
-    df['model_url'] = df['model_url'].apply(clean_url)
-    df['provider_url'] = df['provider_url'].apply(clean_url)
+    # Clean up URLs: strip, and make site-relative paths absolute
+    for col in ('model_url', 'provider_url'):
+        urls = df[col].where(df[col].notna(), '').astype(str).str.strip()
+        relative = urls.ne('') & ~urls.str.startswith(('http://', 'https://'))
+        df[col] = urls.mask(relative, 'https://openrouter.ai/' + urls.str.lstrip('/'))
     
     # Clean other text fields
     text_columns = ['name', 'description', 'provider', 'architecture']
     for col in text_columns:
         if col in df.columns:
-            df[col] = df[col].apply(lambda x: str(x).strip() if pd.notna(x) else '')
+            df[col] = df[col].where(df[col].notna(), '').astype(str).str.strip()
     
     # Remove duplicates
     original_count = len(df)
@@ -1031,6 +1182,9 @@ if __name__ == "__main__":
         
     else:
         print("Failed to scrape models. Please check the website structure or try again later.")
-        print("Debug files created:")
-        print("- debug_page.html: Raw HTML from the website")
-        print("- debug_next_data.json: JSON data extracted (if any)")
\ No newline at end of file
+        if logger.isEnabledFor(logging.DEBUG):
+            print("Debug files created:")
+            print("- debug_page.html: Raw HTML from the website")
+            print("- debug_next_data.json: JSON data extracted (if any)")
+        else:
+            print("Set the log level to DEBUG to save debug_page.html and debug_next_data.json")
\ No newline at end of file